@@ -35,11 +35,13 @@
         "security/ir.model.access.csv",
         "security/pos_security.xml",
         "data/queue_job_data.xml",
+        "data/ir_cron_data.xml",
         "data/product_decimal_precision.xml",
         "data/ecommerce_data.xml",
         "views/pos_backend_view.xml",
         "views/product_view.xml",
         "views/product_category_view.xml",
+        "views/stock_location_view.xml",
         "views/connector_pos_menu.xml",
         "views/queue_job_views.xml",
         'views/assets.xml',
@@ -2,6 +2,7 @@
 from . import core
 from . import backend_adapter
 from . import binder
+from . import lock_manager
 from . import importer
 from . import exporter
 from . import listener
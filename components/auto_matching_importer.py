@@ -76,7 +76,8 @@ class AutoMatchingImporter(Component):
         # Initialize the binder for mapping POS IDs to Odoo IDs
         binder = self.binder_for()
         
-        # Loop through each POS ID
+        # Split the POS IDs between the already mapped ones and the others
+        unmapped_pos_ids = []
         for pos_id in pos_ids:
             # Check if the POS ID is already mapped to an Odoo ID
             record = binder.to_internal(pos_id)
@@ -88,45 +89,51 @@ class AutoMatchingImporter(Component):
                 )
                 nr_pos_already_mapped += 1
             else:
-                # Handle POS IDs that are not mapped yet
-                pos_dict = adapter.read(pos_id)  # Read field values from POS
-                mapping_found = False
-                
-                # Loop through ERP IDs to find a match
-                pos_val = pos_dict[self._pos_field]
-                for erp_dict in erp_list_dict:
-                    erp_val = erp_dict[self._erp_field]
-                    if self._compare_function(pos_val, erp_val, pos_dict, erp_dict):
-                        # Match found, create a new Odoo entry and bind the POS ID
-                        data = {
-                            "odoo_id": erp_dict["id"],
-                            "backend_id": self.backend_record.id,
-                        }
-                        for oe_field, pos_field in self._copy_fields:
-                            data[oe_field] = pos_dict[pos_field]
-                        record = self.model.create(data)
-                        binder.bind(pos_id, record)
-                        _logger.debug(
-                            "[%s] Mapping POS '%s' (%s) to Odoo '%s' (%s)"
-                            % (
-                                self.model._name,
-                                pos_dict["name"],  # Not hardcoded, change if needed
-                                pos_dict[self._pos_field],
-                                erp_dict[erp_rec_name],
-                                erp_dict[self._erp_field],
-                            )
+                unmapped_pos_ids.append(pos_id)
+
+        # Read field values from POS in chunks rather than one call per ID
+        pos_dicts = adapter.read_many(unmapped_pos_ids)
+
+        # Loop through each POS ID not mapped yet
+        for pos_id in unmapped_pos_ids:
+            pos_dict = pos_dicts[int(pos_id)]
+            mapping_found = False
+            
+            # Loop through ERP IDs to find a match
+            pos_val = pos_dict[self._pos_field]
+            for erp_dict in erp_list_dict:
+                erp_val = erp_dict[self._erp_field]
+                if self._compare_function(pos_val, erp_val, pos_dict, erp_dict):
+                    # Match found, create a new Odoo entry and bind the POS ID
+                    data = {
+                        "odoo_id": erp_dict["id"],
+                        "backend_id": self.backend_record.id,
+                    }
+                    for oe_field, pos_field in self._copy_fields:
+                        data[oe_field] = pos_dict[pos_field]
+                    record = self.model.create(data)
+                    binder.bind(pos_id, record)
+                    _logger.debug(
+                        "[%s] Mapping POS '%s' (%s) to Odoo '%s' (%s)"
+                        % (
+                            self.model._name,
+                            pos_dict["name"],  # Not hardcoded, change if needed
+                            pos_dict[self._pos_field],
+                            erp_dict[erp_rec_name],
+                            erp_dict[self._erp_field],
                         )
-                        nr_pos_mapped += 1
-                        mapping_found = True
-                        break
-                
-                if not mapping_found:
-                    # No match found, print a warning
-                    _logger.warning(
-                        "[%s] POS '%s' (%s) was not mapped to any Odoo entry"
-                        % (self.model._name, pos_dict["name"], pos_dict[self._pos_field])
                     )
-                    nr_pos_not_mapped += 1
+                    nr_pos_mapped += 1
+                    mapping_found = True
+                    break
+            
+            if not mapping_found:
+                # No match found, print a warning
+                _logger.warning(
+                    "[%s] POS '%s' (%s) was not mapped to any Odoo entry"
+                    % (self.model._name, pos_dict["name"], pos_dict[self._pos_field])
+                )
+                nr_pos_not_mapped += 1
         
         # Log synchronization summary
         _logger.info(
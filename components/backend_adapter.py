@@ -1,7 +1,14 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+import asyncio
 import base64
+import copy
+import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from urllib.parse import urljoin
 
@@ -11,6 +18,7 @@ from ...pospyt.pospyt import (
     PosWebServiceError
 )
 
+from requests.adapters import HTTPAdapter
 from requests.exceptions import (
     ConnectionError as ConnError,
     HTTPError,
@@ -83,6 +91,169 @@ class PosLocation:
         self.api_url = self.location
 
 
+class PosClientPool:
+    """Per-process pool of keep-alive webservice clients.
+
+    Building a ``PosWebServiceDict`` opens a new HTTP session, so every
+    adapter instance used to pay a new TCP/TLS handshake. The pool keeps one
+    client per backend and hands it to all the adapters of that backend.
+
+    Clients are keyed on the backend id, location, webservice key and debug
+    flag: changing the connection settings of a backend naturally stops
+    using the old client, and :meth:`invalidate` drops it right away.
+    Clients unused for longer than their idle timeout are closed.
+
+    A client is in use as long as a work context opened with :meth:`use` is
+    open, a client in use is never closed by the purge of the idle clients
+    nor by :meth:`invalidate`, it is closed once released.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._clients = {}
+
+    @staticmethod
+    def _key(backend):
+        return (
+            backend.env.cr.dbname,
+            backend.id,
+            backend.location,
+            backend.webservice_key,
+            bool(backend.debug),
+        )
+
+    def _build_client(self, backend):
+        pos = PosLocation(backend.location, backend.webservice_key)
+        client = PosWebServiceDict(
+            pos.api_url,
+            pos.webservice_key,
+            debug=backend.debug,
+            # verbose=backend.verbose
+        )
+        session = getattr(client, "client", None)
+        pool_size = backend.connection_pool_size or 1
+        if session is not None and hasattr(session, "mount"):
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        return pos, client
+
+    @staticmethod
+    def _close_client(client):
+        session = getattr(client, "client", None)
+        if session is not None and hasattr(session, "close"):
+            session.close()
+
+    def _purge_idle(self, now):
+        for key, entry in list(self._clients.items()):
+            if (
+                not entry["users"]
+                and entry["idle_timeout"]
+                and now - entry["last_used"] > entry["idle_timeout"]
+            ):
+                del self._clients[key]
+                self._close_client(entry["client"])
+
+    def _get_entry(self, backend):
+        key = self._key(backend)
+        now = time.monotonic()
+        self._purge_idle(now)
+        entry = self._clients.get(key)
+        if not entry:
+            pos, client = self._build_client(backend)
+            _logger.debug("New webservice client for backend %s", backend.id)
+            entry = self._clients[key] = {
+                "pos": pos,
+                "client": client,
+                "users": 0,
+                "closed": False,
+            }
+        entry["last_used"] = now
+        entry["idle_timeout"] = backend.connection_idle_timeout
+        return entry
+
+    def get(self, backend):
+        """Return a ``(PosLocation, PosWebServiceDict)`` pair for the backend"""
+        with self._lock:
+            entry = self._get_entry(backend)
+            return entry["pos"], entry["client"]
+
+    @contextmanager
+    def use(self, backend):
+        """Keep the client of the backend in use for the duration of the block"""
+        with self._lock:
+            entry = self._get_entry(backend)
+            entry["users"] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                entry["users"] -= 1
+                entry["last_used"] = time.monotonic()
+                if entry["closed"] and not entry["users"]:
+                    self._close_client(entry["client"])
+
+    def invalidate(self, backend_ids=None):
+        """Close the clients of the given backends (all if ``None``)
+
+        The clients in use are closed when they are released.
+        """
+        with self._lock:
+            for key, entry in list(self._clients.items()):
+                if backend_ids is None or key[1] in backend_ids:
+                    del self._clients[key]
+                    if entry["users"]:
+                        entry["closed"] = True
+                    else:
+                        self._close_client(entry["client"])
+
+
+client_pool = PosClientPool()
+
+
+class PosRecordCache:
+    """Read-through cache of the POS records fetched during one job.
+
+    An instance is created by ``pos.backend.work_on`` and travels with the
+    work context (and its children), so every adapter used by the same job
+    shares it. It is dropped with the work context at the end of the job.
+
+    At most ``max_entries`` records are kept, the least recently used ones
+    are evicted first, so a batch job listing many pages keeps a constant
+    memory footprint.
+    """
+
+    def __init__(self, max_entries=1000):
+        self._records = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(pos_model, method, args):
+        return (pos_model, method, json.dumps(args, sort_keys=True, default=str))
+
+    def get(self, pos_model, method, args):
+        key = self._key(pos_model, method, args)
+        if key in self._records:
+            self.hits += 1
+            self._records.move_to_end(key)
+            return True, copy.deepcopy(self._records[key])
+        self.misses += 1
+        return False, None
+
+    def set(self, pos_model, method, args, value):
+        key = self._key(pos_model, method, args)
+        self._records[key] = copy.deepcopy(value)
+        self._records.move_to_end(key)
+        while len(self._records) > self.max_entries:
+            self._records.popitem(last=False)
+
+    def invalidate(self, pos_model):
+        for key in [key for key in self._records if key[0] == pos_model]:
+            del self._records[key]
+
+
 class PosCRUDAdapter(AbstractComponent):
     """External Records Adapter for Pos"""
 
@@ -98,15 +269,7 @@ class PosCRUDAdapter(AbstractComponent):
         :type environment: :py:class:`connector.connector.ConnectorEnvironment`
         """
         super().__init__(environment)
-        self.pos = PosLocation(
-            self.backend_record.location, self.backend_record.webservice_key
-        )
-        self.client = PosWebServiceDict(
-            self.pos.api_url,
-            self.pos.webservice_key,
-            debug=self.backend_record.debug,
-            # verbose=self.backend_record.verbose
-        )
+        self.pos, self.client = client_pool.get(self.backend_record)
 
     def search(self, filters=None):
         """Search records according to some criterias
@@ -148,6 +311,15 @@ class GenericAdapter(AbstractComponent):
     _export_node_name = ""
     _export_node_name_res = ""
 
+    def _get_record_cache(self):
+        """Return the job-scoped :class:`PosRecordCache`, if any"""
+        return getattr(self.work, "pos_record_cache", None)
+
+    def _invalidate_record_cache(self, pos_model=None):
+        cache = self._get_record_cache()
+        if cache is not None:
+            cache.invalidate(pos_model or self._pos_model)
+
     @retryable_error
     def search(self, filters=None):
         """
@@ -188,8 +360,56 @@ class GenericAdapter(AbstractComponent):
         print(
             "method list, model %s, filters %s", self._pos_model, str(filters)
         )
-        return self.client.list(self._pos_model, filters)
+        res = self.client.list(self._pos_model, filters)
+        # The pages are not cached, their filters never repeat, only their
+        # records are kept for the reads of the same job
+        cache = self._get_record_cache()
+        if cache is not None:
+            for record in res or []:
+                cache.set(self._pos_model, "read", int(record["id"]), record)
+        return res
+
+
+    async def _list_pages_async(self, filters, pages, executor, concurrency):
+        loop = asyncio.get_event_loop()
+        semaphore = asyncio.Semaphore(concurrency)
 
+        async def fetch(page):
+            page_filters = dict(filters, page=page)
+            async with semaphore:
+                return await loop.run_in_executor(executor, self.list, page_filters)
+
+        return await asyncio.gather(*(fetch(page) for page in pages))
+
+    def list_pages(self, filters, pages, concurrency=4):
+        """
+        List several pages of records concurrently.
+
+        The blocking webservice client is driven from an asyncio event loop,
+        at most `concurrency` requests being in flight at the same time.
+
+        Args:
+            filters (Dict[str, Any]): The criteria or filters to apply, including `limit`.
+            pages (Iterable[int]): The page numbers to fetch.
+            concurrency (int): The maximum number of concurrent requests. Defaults to 4.
+
+        Returns:
+            list: One list of records per requested page, in the order of `pages`.
+
+        Raises:
+            Exception: If an error occurs while listing one of the pages.
+
+        """
+        pages = list(pages)
+        concurrency = max(1, min(concurrency, len(pages)))
+        loop = asyncio.new_event_loop()
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                return loop.run_until_complete(
+                    self._list_pages_async(filters, pages, executor, concurrency)
+                )
+        finally:
+            loop.close()
 
     @retryable_error
     def read(self, id_, attributes=None):
@@ -212,9 +432,63 @@ class GenericAdapter(AbstractComponent):
             f"method read, model {self._pos_model} id {id_}"
         )
 
+        cache = self._get_record_cache()
+        if cache is not None:
+            found, res = cache.get(self._pos_model, "read", int(id_))
+            if found:
+                return res
         res = self.client.find(self._pos_model, id_)
+        if cache is not None:
+            cache.set(self._pos_model, "read", int(id_), res)
         return res
 
+    @retryable_error
+    def read_many(self, ids, chunk_size=100):
+        """
+        Returns the information of several records, fetched by chunks.
+
+        Args:
+            ids (List[Union[int, str]]): The identifiers of the records to retrieve.
+            chunk_size (int): The number of records requested per call to the
+                POS `list` endpoint. Defaults to 100.
+
+        Returns:
+            dict: The records information keyed by their identifier (as int).
+                Records not returned by the `list` endpoint are read one by one.
+
+        Raises:
+            Exception: If an error occurs during the retrieval.
+
+        """
+        ids = list(dict.fromkeys(int(id_) for id_ in ids if id_))
+        records = {}
+        cache = self._get_record_cache()
+        if cache is not None:
+            for id_ in ids:
+                found, res = cache.get(self._pos_model, "read", id_)
+                if found:
+                    records[id_] = res
+        missing_ids = [id_ for id_ in ids if id_ not in records]
+        for start in range(0, len(missing_ids), chunk_size):
+            chunk = missing_ids[start:start + chunk_size]
+            _logger.debug(
+                "method read_many, model %s ids %s", self._pos_model, chunk
+            )
+            filters = {
+                "filter": {"id": {"operator": "in", "value": chunk}},
+                "limit": len(chunk),
+            }
+            chunk_ids = set(chunk)
+            for record in self.client.list(self._pos_model, filters) or []:
+                if int(record["id"]) in chunk_ids:
+                    records[int(record["id"])] = record
+                    if cache is not None:
+                        cache.set(self._pos_model, "read", int(record["id"]), record)
+        for id_ in ids:
+            if id_ not in records:
+                records[id_] = self.read(id_)
+        return records
+
 
     def create(self, attributes=None):
         """
@@ -236,6 +510,7 @@ class GenericAdapter(AbstractComponent):
             f"method create, model {self._pos_model}, attributes {str(attributes)}"
         )
 
+        self._invalidate_record_cache()
         res = self.client.add(
             self._pos_model, {self._export_node_name: attributes}
         )
@@ -267,6 +542,7 @@ class GenericAdapter(AbstractComponent):
             self._pos_model,
             str(attributes),
         )
+        self._invalidate_record_cache()
         res = self.client.edit(
             self._pos_model, {self._export_node_name: attributes}
         )
@@ -296,6 +572,7 @@ class GenericAdapter(AbstractComponent):
             "method delete, model %s, ids %s", resource, str(ids)
         )
         # Delete a record(s) on the external system
+        self._invalidate_record_cache(resource)
         return self.client.delete(resource, ids)
 
     @retryable_error
@@ -1,7 +1,68 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+import logging
+from contextlib import contextmanager
+
+from odoo import tools
+
 from odoo.addons.component.core import Component
 
+_logger = logging.getLogger(__name__)
+
+
+class PosBinderIndex:
+    """In-memory index of the Pos ids bound during one job.
+
+    An instance is created by ``pos.backend.work_on`` and travels with the
+    work context (and its children), so every binder used by the same job
+    shares it. The ``pos_id -> binding id`` map of a binding model is
+    loaded with a single query the first time the model is looked up, and
+    kept up to date by ``bind()``.
+    """
+
+    def __init__(self):
+        self._maps = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_map(self, model_name, backend_id):
+        return self._maps.get((model_name, backend_id))
+
+    def load(self, model_name, backend_id, mapping):
+        self._maps[(model_name, backend_id)] = mapping
+        return mapping
+
+    def set(self, model_name, backend_id, external_id, binding_id):
+        mapping = self.get_map(model_name, backend_id)
+        if mapping is not None:
+            mapping[tools.ustr(external_id)] = binding_id
+
+    def invalidate(self, model_name=None):
+        if model_name is None:
+            self._maps.clear()
+            return
+        for key in [key for key in self._maps if key[0] == model_name]:
+            del self._maps[key]
+
+
+@contextmanager
+def binder_index_savepoint(work):
+    """
+    Context manager: run the block in a savepoint.
+
+    The bindings created in a savepoint which is rolled back do not exist
+    anymore, the binder index of the work context is dropped and reloaded
+    on its next use.
+    """
+    try:
+        with work.env.cr.savepoint():
+            yield
+    except Exception:
+        index = getattr(work, "binder_index", None)
+        if index is not None:
+            index.invalidate()
+        raise
+
 
 class PosModelBinder(Component):
     """Bind records and give odoo/pos ids correspondence
@@ -34,3 +95,179 @@ class PosModelBinder(Component):
         "pos.sale.order.state",
         "pos.sale.order.state.exporter"
     ]
+
+    def _get_index(self):
+        """
+        Return the ``pos_id -> binding id`` map of the binding model.
+
+        The map is loaded on first use from the binder index of the work
+        context, there is no map when the work context has no index.
+
+        :return: The map of the Pos ids to the binding ids or None.
+        :rtype: dict | None
+        """
+        index = getattr(self.work, "binder_index", None)
+        if index is None:
+            return None
+        backend_id = self.backend_record.id
+        mapping = index.get_map(self.model._name, backend_id)
+        if mapping is None:
+            self.model.flush([self._external_field, self._backend_field])
+            self.env.cr.execute(
+                'SELECT "{external}", id FROM "{table}" '
+                'WHERE "{backend}" = %s AND "{external}" IS NOT NULL'.format(
+                    external=self._external_field,
+                    backend=self._backend_field,
+                    table=self.model._table,
+                ),
+                (backend_id,),
+            )
+            mapping = index.load(
+                self.model._name,
+                backend_id,
+                {tools.ustr(external_id): id_ for external_id, id_ in self.env.cr.fetchall()},
+            )
+            _logger.debug(
+                "Binder index of %s loaded with %d bindings",
+                self.model._name,
+                len(mapping),
+            )
+        return mapping
+
+    def _index_hit(self, external_id):
+        """Return the binding id of `external_id` found in the index, if any"""
+        mapping = self._get_index()
+        if mapping is None:
+            return None
+        index = self.work.binder_index
+        binding_id = mapping.get(tools.ustr(external_id))
+        if binding_id is None:
+            index.misses += 1
+        else:
+            index.hits += 1
+        return binding_id
+
+    def to_internal(self, external_id, unwrap=False):
+        """Give the Odoo recordset for an external ID
+
+        The bindings are looked up in the binder index of the work context
+        when there is one. The bindings missing from the index, which may
+        have been created without ``bind()``, are searched in the database.
+
+        :param external_id: external ID for which we want
+                            the Odoo ID
+        :param unwrap: if True, returns the normal record
+                       else return the binding record
+        :return: a recordset, depending on the value of unwrap,
+                 or an empty recordset if the external_id is not mapped,
+                 with ``active_test=False`` in its context whether it has
+                 been found in the index or in the database
+        :rtype: recordset
+        """
+        binding_id = self._index_hit(external_id)
+        if binding_id is None:
+            bindings = super().to_internal(external_id, unwrap=False).with_context(
+                active_test=False
+            )
+            index = getattr(self.work, "binder_index", None)
+            if bindings and index is not None:
+                index.set(self.model._name, self.backend_record.id, external_id, bindings.id)
+        else:
+            bindings = self.model.with_context(active_test=False).browse(binding_id)
+        if unwrap:
+            return bindings[self._odoo_field]
+        return bindings
+
+    def bind(self, external_id, binding):
+        """Create the link between an external ID and an Odoo ID
+
+        Also record the binding in the binder index of the work context.
+
+        :param external_id: external id to bind
+        :param binding: Odoo record to bind
+        :type binding: int
+        """
+        super().bind(external_id, binding)
+        index = getattr(self.work, "binder_index", None)
+        if index is not None:
+            if isinstance(binding, int):
+                binding = self.model.browse(binding)
+            index.set(self.model._name, self.backend_record.id, external_id, binding.id)
+
+    def to_internal_many(self, external_ids, unwrap=False):
+        """Give the Odoo recordsets for a list of external IDs
+
+        The bindings missing from the binder index of the work context are
+        searched with a single query.
+
+        :param external_ids: external IDs for which we want the Odoo IDs
+        :param unwrap: if True, returns the normal records
+                       else return the binding records
+        :return: a dict with the recordset of each external ID, in the
+                 order of `external_ids`, an empty recordset when an
+                 external ID is not mapped
+        :rtype: dict
+        """
+        external_ids = list(dict.fromkeys(external_ids))
+        mapping = self._get_index()
+        binding_ids = {}
+        missing = []
+        for external_id in external_ids:
+            binding_id = mapping.get(tools.ustr(external_id)) if mapping is not None else None
+            if binding_id is None:
+                missing.append(external_id)
+            else:
+                binding_ids[external_id] = binding_id
+
+        if missing:
+            by_key = {tools.ustr(external_id): external_id for external_id in missing}
+            bindings = self.model.with_context(active_test=False).search(
+                [
+                    (self._external_field, "in", list(by_key)),
+                    (self._backend_field, "=", self.backend_record.id),
+                ]
+            )
+            for binding in bindings:
+                external_id = by_key[tools.ustr(binding[self._external_field])]
+                binding_ids[external_id] = binding.id
+                if mapping is not None:
+                    mapping[tools.ustr(external_id)] = binding.id
+
+        records = self.model.with_context(active_test=False).browse(
+            list(binding_ids.values())
+        )
+        by_id = {binding.id: binding for binding in records}
+        result = {}
+        for external_id in external_ids:
+            binding = by_id.get(binding_ids.get(external_id), self.model.browse())
+            result[external_id] = binding[self._odoo_field] if unwrap else binding
+        return result
+
+    def to_external_many(self, records, wrap=False):
+        """Give the external IDs for Odoo records
+
+        :param records: Odoo records for which we want the external IDs
+        :param wrap: if True, `records` are normal records, their bindings
+                     on the backend are searched with a single query
+        :return: a dict with the external ID of each record id, None when
+                 the record is not bound
+        :rtype: dict
+        """
+        if wrap:
+            bindings = self.model.with_context(active_test=False).search(
+                [
+                    (self._odoo_field, "in", records.ids),
+                    (self._backend_field, "=", self.backend_record.id),
+                ]
+            )
+            external_ids = {
+                binding[self._odoo_field].id: binding[self._external_field]
+                for binding in bindings
+            }
+        else:
+            external_ids = {
+                binding.id: binding[self._external_field] for binding in records
+            }
+        return {
+            record.id: external_ids.get(record.id) or None for record in records
+        }
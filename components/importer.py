@@ -1,19 +1,32 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+import datetime
+import hashlib
+import json
 import logging
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing, contextmanager
 
+import psycopg2
+
 import odoo
 from odoo import _
 
-from odoo.addons.component.core import AbstractComponent
+from odoo.addons.component.core import AbstractComponent, Component
 from odoo.addons.queue_job.exception import FailedJobError, RetryableJobError
+from odoo.addons.queue_job.job import ENQUEUED, PENDING, Job
+
+from .binder import binder_index_savepoint
 
 _logger = logging.getLogger(__name__)
 
 RETRY_ON_ADVISORY_LOCK = 1  # seconds
 RETRY_WHEN_CONCURRENT_DETECTED = 1  # seconds
+# Wait on a row locked by another worker of a direct batch import before
+# importing the record again once the previous records are committed
+LOCK_TIMEOUT_IN_NEW_ENV = "5s"
 
 
 def import_record():
@@ -79,6 +92,60 @@ class PosBaseImporter(AbstractComponent):
             except:
                 return
 
+    def _import_dependencies_many(self, dependencies, **kwargs):
+        """
+        Import the dependencies which are not bound yet.
+
+        The dependencies are grouped by binding model and the Pos IDs
+        already bound are resolved with a single query per model. Only the
+        missing ones are imported, model after model in the order of their
+        first dependency (e.g. the options before their values).
+
+        :param dependencies: The ``(pos_id, binding_model)`` of the
+                             dependencies, `pos_id` may be the Pos record.
+        :type dependencies: list
+        :param kwargs: Additional keyword arguments passed to the importers.
+        :return: The ``(pos_id, binding_model)`` of the dependencies which
+                 failed to be imported.
+        :rtype: list
+        """
+        planned = {}
+        for pos_id, binding_model in dependencies:
+            if not pos_id:
+                continue
+            key = pos_id["id"] if isinstance(pos_id, dict) else pos_id
+            planned.setdefault(binding_model, {}).setdefault(key, pos_id)
+
+        failed = []
+        lock_manager = self.component(usage="import.lock.manager")
+        for binding_model, records in planned.items():
+            bindings = self.binder_for(binding_model).to_internal_many(list(records))
+            missing = [record for key, record in records.items() if not bindings[key]]
+            _logger.debug(
+                "%d/%d %s dependencies to import",
+                len(missing),
+                len(records),
+                binding_model,
+            )
+            for record in missing:
+                importer = self.component(usage="record.importer", model_name=binding_model)
+                try:
+                    # A failed query must not abort the transaction of the
+                    # record and of the next dependencies
+                    with lock_manager.savepoint():
+                        importer.run(record, **kwargs)
+                except Exception:
+                    # As in `_import_dependency`, a dependency which cannot
+                    # be imported does not prevent the import of the record
+                    _logger.debug(
+                        "Dependency %s %s could not be imported",
+                        binding_model,
+                        record["id"] if isinstance(record, dict) else record,
+                        exc_info=True,
+                    )
+                    failed.append((record, binding_model))
+        return failed
+
 
 class PosImporter(AbstractComponent):
     """Base importer for Pos"""
@@ -87,6 +154,13 @@ class PosImporter(AbstractComponent):
     _inherit = "pos.base.importer"
     _usage = "record.importer"
 
+    # Records shared by many imports (e.g. categories), for which a
+    # concurrent import is checked in a new transaction before the import
+    _concurrency_sensitive = False
+    # Field of the binding storing the hash of the last imported Pos record,
+    # an unchanged record is not imported again
+    _payload_hash_field = None
+
     def __init__(self, environment):
         """
         Initialize the object.
@@ -328,6 +402,54 @@ class PosImporter(AbstractComponent):
                     ignore_retry=True,
                 )
 
+    def _check_concurrency_in_new_env(self):
+        """
+        Return True if a concurrent import must be checked in a new transaction.
+
+        Otherwise, a concurrent import is detected by the unique constraint
+        on the Pos ID of the binding when the binding is created.
+
+        :rtype: bool
+        """
+        return (
+            self._concurrency_sensitive
+            or self.backend_record.import_concurrency_check == "new_cursor"
+        )
+
+    @contextmanager
+    def _retry_unique_violation(self):
+        """
+        Context manager: catch Unique constraint error and retry the job later.
+
+        The block runs in a savepoint, so the transaction can still be used
+        when the error is caught. The bindings created in the savepoint are
+        dropped from the binder index when it is rolled back.
+
+        Only a violation of the unique Pos ID of the binding is retried, any
+        other unique constraint is a data error which would fail again.
+
+        :raises RetryableJobError: If the binding has been created by a
+                                   concurrent import meanwhile.
+        """
+        try:
+            with binder_index_savepoint(self.work):
+                yield
+                self.env["base"].flush()
+        except psycopg2.IntegrityError as err:
+            if (
+                err.pgcode == psycopg2.errorcodes.UNIQUE_VIOLATION
+                and err.diag.constraint_name == "%s_pos_uniq" % self.model._table
+            ):
+                raise RetryableJobError(
+                    "A database error caused the failure of the job:\n"
+                    "%s\n\n"
+                    "This error is likely due to two concurrent jobs attempting "
+                    "to import the same record. The job will be retried later." % err,
+                    seconds=RETRY_WHEN_CONCURRENT_DETECTED,
+                    ignore_retry=True,
+                ) from err
+            raise
+
     def run(self, pos_id, **kwargs):
         """
         Run the synchronization process.
@@ -338,20 +460,18 @@ class PosImporter(AbstractComponent):
                 an error occurs during the process.
         :rtype: Any
         """
+        if isinstance(pos_id, dict) and "payload_ref" in pos_id:
+            pos_id = self._resolve_payload(pos_id)
+
         if isinstance(pos_id, dict):
             self.pos_id = pos_id["id"]
         else:
             self.pos_id = pos_id
 
-        lock_name = "import({}, {}, {}, {})".format(
-            self.backend_record._name,
-            self.backend_record.id,
-            self.model._name,
-            self.pos_id,
-        )
-
-        # Keep a lock on this import until the transaction is committed
-        self.advisory_lock_or_retry(lock_name, retry_seconds=RETRY_ON_ADVISORY_LOCK)
+        # Keep a lock on this import until the transaction is committed,
+        # unless the whole chunk of records is already locked by the job
+        lock_manager = self.component(usage="import.lock.manager")
+        lock_manager.acquire_or_retry(self.pos_id, retry_seconds=RETRY_ON_ADVISORY_LOCK)
         if not self.pos_record:
             if isinstance(pos_id, dict):
                 self.pos_record = pos_id
@@ -361,7 +481,7 @@ class PosImporter(AbstractComponent):
         # put back a not active test domain so the rest of the import process
         # happen in normal conditions
         binding = self._get_binding().with_context(active_test=True)
-        if not binding:
+        if not binding and self._check_concurrency_in_new_env():
             self._check_in_new_connector_env()
 
         # Binding is current pos model object
@@ -369,10 +489,78 @@ class PosImporter(AbstractComponent):
         if skip:
             return skip
 
+        if not kwargs.get("force") and self._is_unchanged(binding):
+            _logger.debug(
+                "%s %s unchanged on Pos, import skipped", self.model._name, self.pos_id
+            )
+            return _("Already up-to-date.")
+
         # import the missing linked resources
         self._import_dependencies()
         self._import(binding, **kwargs)
 
+    def _get_payload_hash(self):
+        """Return the hash of the normalized Pos record"""
+        content = json.dumps(self.pos_record, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def _is_unchanged(self, binding):
+        """
+        Return True if the Pos record is the same as the last one imported.
+
+        :param binding: The existing binding record, if it exists.
+        :rtype: bool
+        """
+        if not self._payload_hash_field or not binding:
+            return False
+        return binding[self._payload_hash_field] == self._get_payload_hash()
+
+    def _get_changed_values(self, binding, data):
+        """
+        Return the values of `data` which differ from the binding.
+
+        :param binding: The binding record to update.
+        :param data: The values mapped from the Pos record.
+        :type data: dict
+        :rtype: dict
+        """
+        changed = {}
+        for name, value in data.items():
+            field = binding._fields.get(name)
+            if field is None or field.type == "one2many":
+                changed[name] = value
+                continue
+            try:
+                new_value = field.convert_to_cache(value, binding, validate=False)
+                old_value = field.convert_to_cache(binding[name], binding, validate=False)
+            except (TypeError, ValueError):
+                changed[name] = value
+                continue
+            if new_value != old_value:
+                changed[name] = value
+        return changed
+
+    def _resolve_payload(self, payload_ref):
+        """
+        Return the record stored by the batch importer.
+
+        :param payload_ref: A dict with the `id` of the record on Pos and
+                            the `payload_ref` of its stored payload.
+        :type payload_ref: dict
+        :return: The record, or its ID when the payload has expired so that
+                 it is fetched from Pos again.
+        :rtype: dict | int
+        """
+        record = self.env["pos.payload"].load(payload_ref["payload_ref"])
+        if record is None:
+            _logger.debug(
+                "Payload of %s %s expired, read it from Pos",
+                self.model._name,
+                payload_ref["id"],
+            )
+            return payload_ref["id"]
+        return record
+
     def _import(self, binding, **kwargs):
         """
         Import the external record.
@@ -394,12 +582,23 @@ class PosImporter(AbstractComponent):
         # Perform a special check on the data before the import
         self._validate_data(record)
 
+        if self._payload_hash_field:
+            record[self._payload_hash_field] = self._get_payload_hash()
+            if binding and not kwargs.get("force"):
+                record = self._get_changed_values(binding, record)
+
         if binding:
             self._update(binding, record)
-        else:
+            self.binder.bind(self.pos_id, binding)
+        elif self._check_concurrency_in_new_env():
             binding = self._create(record)
-
-        self.binder.bind(self.pos_id, binding)
+            self.binder.bind(self.pos_id, binding)
+        else:
+            # A concurrent import of the record violates the unique
+            # constraint on its Pos ID
+            with self._retry_unique_violation():
+                binding = self._create(record)
+                self.binder.bind(self.pos_id, binding)
 
         self._after_import(binding)
 
@@ -417,6 +616,18 @@ class BatchImporter(AbstractComponent):
 
     page_size = 100
 
+    def __init__(self, environment):
+        """
+        Initialize the object.
+
+        :param environment: Current environment (backend, session, ...)
+        :type environment: :py:class:`connector.connector.ConnectorEnvironment`
+        """
+        super().__init__(environment)
+        self.import_state = None
+        self.next_page_size = None
+        self.max_updated_at = None
+
     def run(self, filters=None, **kwargs):
         """
         Run the synchronization process.
@@ -427,24 +638,189 @@ class BatchImporter(AbstractComponent):
         """
         if filters is None:
             filters = {}
+        import_state = self.backend_record._get_import_state(self.model._name)
+        self.import_state = import_state
         if "limit" in filters:
             self._run_page(filters, **kwargs)
+            self._save_high_water_mark()
             return
 
         # Make a copy of filters to prevent applying the parameters to other batch imports
         filters = filters.copy()
+
+        self.page_size = import_state.page_size or self.page_size
+        if import_state.pagination == "cursor":
+            if self._run_cursor(filters, import_state, **kwargs):
+                self._save_page_size()
+                self._save_high_water_mark()
+                return
+            _logger.warning(
+                "The cursor of %s does not move, Pos probably does not support "
+                "cursor pagination. Falling back to page numbers.",
+                self.model._name,
+            )
         
         # Init pagination parameter
         page_number = 1
         filters["limit"] = self.page_size
         filters["page"] = page_number
 
+        concurrency = self._get_page_concurrency()
+        if concurrency > 1:
+            self._run_concurrent_pages(filters, concurrency, **kwargs)
+            self._save_high_water_mark()
+            return
+
         record_ids = self._run_page(filters, **kwargs)
         while len(record_ids) == self.page_size:
             page_number += 1
             filters["page"] = page_number
             record_ids = self._run_page(filters, **kwargs)
+        # The page numbers depend on the limit, the adapted size can
+        # only be used from the next run
+        self._save_page_size()
+        self._save_high_water_mark()
+
+    def _fetch_page(self, filters):
+        """
+        List a page of records and feed the page size controller.
+
+        :param filters: Filters to apply for retrieving the records.
+        :type filters: dict
+        :return: The records of the page.
+        :rtype: list
+        """
+        start = time.monotonic()
+        records = self.backend_adapter.list(filters)
+        elapsed = time.monotonic() - start
+        self._track_updated_at(records)
+        if self.import_state and self.import_state.adaptive_page_size:
+            payload_size = len(json.dumps(records, default=str))
+            self.next_page_size = self.import_state.compute_next_page_size(
+                filters.get("limit", self.page_size), len(records), elapsed, payload_size
+            )
+        return records
+
+    def _track_updated_at(self, records):
+        """Keep the highest `updated_at` of the records fetched"""
+        for record in records:
+            updated_at = self.import_state.parse_updated_at(record.get("updated_at"))
+            if updated_at and (not self.max_updated_at or updated_at > self.max_updated_at):
+                self.max_updated_at = updated_at
+
+    def _save_high_water_mark(self):
+        """
+        Store the highest `updated_at` seen once all the pages are imported.
+
+        It is not stored after each page: the pages are not sorted on
+        `updated_at`, a later page can hold older records.
+        """
+        if self.max_updated_at:
+            self.import_state.update_high_water_mark(self.max_updated_at)
+
+    def _save_page_size(self):
+        """Store the page size chosen by the controller for the next run"""
+        if self.next_page_size and self.next_page_size != self.import_state.page_size:
+            _logger.debug(
+                "Page size of %s set to %d", self.model._name, self.next_page_size
+            )
+            self.import_state.page_size = self.next_page_size
+
+    def _cursor_filters(self, filters, cursor):
+        """
+        Return the filters requesting the page of records following `cursor`.
 
+        The records are sorted on `(updated_at, id)` so that the page only
+        depends on the last record imported, not on an offset.
+
+        :param filters: Filters to apply for retrieving the records.
+        :type filters: dict
+        :param cursor: The `(updated_at, id)` of the last record imported, or None.
+        :type cursor: tuple or None
+        :return: The filters of the next page.
+        :rtype: dict
+        """
+        page_filters = dict(filters, limit=self.page_size, sort="updated_at,id")
+        if cursor:
+            page_filters["after"] = {"updated_at": cursor[0], "id": cursor[1]}
+        return page_filters
+
+    def _cursor_key(self, cursor):
+        """Return a comparable key of a `(updated_at, id)` cursor"""
+        updated_at = self.import_state.parse_updated_at(cursor[0])
+        return (updated_at or datetime.datetime.min, int(cursor[1]))
+
+    def _run_cursor(self, filters, import_state, **kwargs):
+        """
+        Import the records page after page using keyset pagination.
+
+        The cursor of the last record imported is stored on the import state
+        after each page, so the next run resumes right after it.
+
+        The import stops when the last record of a page is not after the
+        cursor: Pos ignored the cursor and would return the same page
+        forever.
+
+        :param filters: Filters to apply for retrieving the records.
+        :type filters: dict
+        :param import_state: The import state of the binding model.
+        :type import_state: recordset of pos.import.state
+        :param kwargs: Additional keyword arguments.
+        :return: False if the cursor did not move, True otherwise.
+        :rtype: bool
+        """
+        cursor = import_state.get_cursor()
+        while True:
+            page_size = self.page_size
+            records = self._fetch_page(self._cursor_filters(filters, cursor))
+            if records:
+                last_record = records[-1]
+                next_cursor = (last_record["updated_at"], last_record["id"])
+                if cursor and self._cursor_key(next_cursor) <= self._cursor_key(
+                    cursor
+                ):
+                    return False
+                self._import_page(records, **kwargs)
+                cursor = next_cursor
+                import_state.set_cursor(*cursor)
+            if len(records) < page_size:
+                return True
+            # The cursor does not depend on the limit, so the page size
+            # can be adapted between two pages
+            self.page_size = self.next_page_size or self.page_size
+
+    def _get_page_concurrency(self):
+        """
+        Return the number of pages to fetch concurrently.
+
+        :return: The number of concurrent page requests, 1 to page sequentially.
+        :rtype: int
+        """
+        return self.backend_record.import_page_concurrency or 1
+
+    def _run_concurrent_pages(self, filters, concurrency, **kwargs):
+        """
+        Fetch the pages by windows of `concurrency` pages requested at once.
+
+        The records are still imported page after page, in order. The next
+        window is only requested when all the pages of the current one were
+        full, so at most `concurrency - 1` empty pages are fetched at the end.
+
+        :param filters: Filters to apply for retrieving the records, with `limit`.
+        :type filters: dict
+        :param concurrency: The number of pages requested concurrently.
+        :type concurrency: int
+        :param kwargs: Additional keyword arguments.
+        """
+        page_number = 1
+        while True:
+            pages = range(page_number, page_number + concurrency)
+            for records in self.backend_adapter.list_pages(filters, pages, concurrency):
+                self._track_updated_at(records)
+                record_ids = self._import_page(records, **kwargs)
+                if len(record_ids) < self.page_size:
+                    return
+            page_number += concurrency
 
     def _run_page(self, filters, **kwargs):
         """
@@ -456,8 +832,19 @@ class BatchImporter(AbstractComponent):
         :return: The list of record IDs processed in this page.
         :rtype: list
         """
-        records = self.backend_adapter.list(filters)
+        records = self._fetch_page(filters)
+        return self._import_page(records, **kwargs)
+
+    def _import_page(self, records, **kwargs):
+        """
+        Import the records of a page already fetched from Pos.
 
+        :param records: The records of the page.
+        :type records: list
+        :param kwargs: Additional keyword arguments.
+        :return: The list of record IDs processed in this page.
+        :rtype: list
+        """
         for record in records:
             self._import_record(record, **kwargs)
 
@@ -507,6 +894,152 @@ class DirectBatchImporter(AbstractComponent):
             backend=self.backend_record, pos_id=external_id
         )
 
+    def _get_import_workers(self):
+        """
+        Return the number of records imported at the same time.
+
+        :return: The number of workers, 1 to import the records in the
+                 current transaction.
+        :rtype: int
+        """
+        if getattr(threading.currentThread(), "testing", False):
+            # The new cursors would not see the data of the test transaction
+            return 1
+        return self.backend_record.direct_import_workers or 1
+
+    def _import_page(self, records, **kwargs):
+        """
+        Import the records of a page, dispatched to a pool of workers.
+
+        The records are imported by slices of as many records as workers,
+        each worker importing a record in its own transaction. The
+        transactions are committed in the order of the records: when a
+        record fails, the transactions of the next records are rolled back
+        and the import stops, so only the first records of the page are
+        committed, up to the failed one.
+
+        A record which failed because of a concurrent import (e.g. two
+        records sharing a parent category) is imported again, with the rest
+        of its slice, one record after the other once the previous records
+        are committed.
+
+        :param records: The records of the page.
+        :type records: list
+        :param kwargs: Additional keyword arguments.
+        :return: The list of record IDs processed in this page.
+        :rtype: list
+        """
+        workers = self._get_import_workers()
+        if workers <= 1 or len(records) <= 1:
+            return super()._import_page(records, **kwargs)
+
+        self.env["base"].flush()
+        args = (
+            self.env.cr.dbname,
+            self.env.uid,
+            dict(self.env.context),
+            self.model._name,
+            self.backend_record.id,
+        )
+        imported = []
+        with ThreadPoolExecutor(max_workers=min(workers, len(records))) as executor:
+            for start in range(0, len(records), workers):
+                chunk = records[start:start + workers]
+                futures = [
+                    executor.submit(self._import_record_in_new_env, *args, record)
+                    for record in chunk
+                ]
+                for index, (record, future) in enumerate(zip(chunk, futures)):
+                    error = future.exception()
+                    if error is None:
+                        self._close_new_env(future.result(), commit=True)
+                        imported.append(record["id"])
+                        continue
+                    errors = [(record["id"], error)]
+                    for next_record, next_future in zip(
+                        chunk[index + 1:], futures[index + 1:]
+                    ):
+                        next_error = next_future.exception()
+                        if next_error is None:
+                            self._close_new_env(next_future.result(), commit=False)
+                        elif not isinstance(next_error, RetryableJobError):
+                            errors.append((next_record["id"], next_error))
+                    if not isinstance(error, RetryableJobError):
+                        self._raise_page_errors(records, imported, errors)
+                    for next_record in chunk[index:]:
+                        try:
+                            cr = self._import_record_in_new_env(*args, next_record)
+                        except Exception as retry_error:
+                            self._raise_page_errors(
+                                records, imported, [(next_record["id"], retry_error)]
+                            )
+                        self._close_new_env(cr, commit=True)
+                        imported.append(next_record["id"])
+                    break
+        return imported
+
+    def _raise_page_errors(self, records, imported, errors):
+        _logger.error(
+            "%s import stopped after %d/%d records",
+            self.model._name,
+            len(imported),
+            len(records),
+        )
+        raise FailedJobError(
+            "\n".join(
+                "%s %s: %s" % (self.model._name, pos_id, error)
+                for pos_id, error in errors
+            )
+        ) from errors[0][1]
+
+    @staticmethod
+    def _import_record_in_new_env(dbname, uid, context, model_name, backend_id, record):
+        """
+        Import a record in a new transaction, left open to be committed by
+        the caller with :meth:`_close_new_env`.
+
+        It does not use the environment of the component, which is bound to
+        the cursor of the caller thread. The transaction is rolled back when
+        the import fails, a wait on a row locked by another worker fails
+        after ``LOCK_TIMEOUT_IN_NEW_ENV``.
+
+        :return: The cursor of the transaction.
+        """
+        with odoo.api.Environment.manage():
+            registry = odoo.modules.registry.Registry(dbname)
+            cr = registry.cursor()
+            env = odoo.api.Environment(cr, uid, context)
+            try:
+                cr.execute("SET LOCAL lock_timeout = %s", (LOCK_TIMEOUT_IN_NEW_ENV,))
+                env[model_name].import_record(
+                    backend=env["pos.backend"].browse(backend_id), pos_id=record
+                )
+                env["base"].flush()
+            except psycopg2.OperationalError as err:
+                cr.rollback()
+                cr.close()
+                if err.pgcode == psycopg2.errorcodes.LOCK_NOT_AVAILABLE:
+                    raise RetryableJobError(
+                        "The record is being imported by another worker.",
+                        seconds=RETRY_WHEN_CONCURRENT_DETECTED,
+                        ignore_retry=True,
+                    ) from err
+                raise
+            except BaseException:
+                cr.rollback()
+                cr.close()
+                raise
+            return cr
+
+    @staticmethod
+    def _close_new_env(cr, commit):
+        """Commit or roll back a transaction of a worker, then close it"""
+        with closing(cr):
+            if commit:
+                cr.commit()
+            else:
+                cr.rollback()
+
 class DelayedBatchImporter(AbstractComponent):
     """
     Batch importer for delaying the import of records.
@@ -530,6 +1063,125 @@ class DelayedBatchImporter(AbstractComponent):
     _inherit = "pos.batch.importer"
     _model_name = None
 
+    _job_options = (
+        "priority",
+        "eta",
+        "max_retries",
+        "description",
+        "channel",
+        "identity_key",
+    )
+
+    def __init__(self, environment):
+        """
+        Initialize the object.
+
+        :param environment: Current environment (backend, session, ...)
+        :type environment: :py:class:`connector.connector.ConnectorEnvironment`
+        """
+        super().__init__(environment)
+        self._job_buffer = None
+
+    def _import_page(self, records, **kwargs):
+        """
+        Delay the import of the records of a page, storing all the jobs at once.
+
+        :param records: The records of the page.
+        :type records: list
+        :param kwargs: Additional keyword arguments.
+        :return: The list of record IDs processed in this page.
+        :rtype: list
+        """
+        self._job_buffer = []
+        try:
+            records = self._store_payloads(records)
+            record_ids = super()._import_page(records, **kwargs)
+            self._store_jobs(self._job_buffer)
+        finally:
+            self._job_buffer = None
+        return record_ids
+
+    def _store_payloads(self, records):
+        """
+        Store the records fetched from Pos and replace them by references.
+
+        The jobs then carry a small `{"id": ..., "payload_ref": ...}` dict
+        instead of the whole record, and the record importer reads the
+        payload back without calling Pos again.
+
+        :param records: The records of the page.
+        :type records: list
+        :return: The references to the stored records.
+        :rtype: list
+        """
+        refs = self.env["pos.payload"].store_many(
+            records, self.backend_record.payload_ttl
+        )
+        return [
+            {"id": record["id"], "payload_ref": ref}
+            for record, ref in zip(records, refs)
+        ]
+
+    def _delay(self, records, method_name, *args, **kwargs):
+        """
+        Delay a call of `method_name` on `records`.
+
+        Inside :meth:`_import_page` the job is only collected and stored with
+        the others of the page, otherwise it is enqueued right away.
+
+        :param records: The recordset the method is called on.
+        :param method_name: The name of the method to delay.
+        :param args: The positional arguments of the method.
+        :param kwargs: The keyword arguments of the method and the job options
+                       (priority, eta, max_retries, description, channel, identity_key).
+        """
+        options = {key: kwargs.pop(key, None) for key in self._job_options}
+        if self._job_buffer is None or self.env.context.get("test_queue_job_no_delay"):
+            delayable = records.with_delay(**options)
+            return getattr(delayable, method_name)(*args, **kwargs)
+        job = Job(getattr(records, method_name), args=args, kwargs=kwargs, **options)
+        self._job_buffer.append(job)
+        return job
+
+    def _store_jobs(self, jobs):
+        """
+        Store the collected jobs in one batch.
+
+        Jobs having an identity key already used by a pending or enqueued
+        job, or by a previous job of the batch, are skipped. The existing
+        identity keys are fetched in a single query.
+
+        :param jobs: The jobs to store.
+        :type jobs: list of :py:class:`odoo.addons.queue_job.job.Job`
+        """
+        if not jobs:
+            return
+        job_model = self.env["queue.job"].sudo()
+        identity_keys = {job.identity_key for job in jobs if job.identity_key}
+        if identity_keys:
+            existing_jobs = job_model.search(
+                [
+                    ("identity_key", "in", list(identity_keys)),
+                    ("state", "in", [PENDING, ENQUEUED]),
+                ]
+            )
+            used_keys = set(existing_jobs.mapped("identity_key"))
+        else:
+            used_keys = set()
+
+        vals_list = []
+        for job in jobs:
+            if job.identity_key:
+                if job.identity_key in used_keys:
+                    _logger.debug("A job with the same identity key exists, %s skipped", job)
+                    continue
+                used_keys.add(job.identity_key)
+            vals_list.append(job._store_values(create=True))
+        job_model.with_context(_job_edit_sentinel=job_model.EDIT_SENTINEL).create(
+            vals_list
+        )
+        _logger.debug("%d jobs stored for %s", len(vals_list), self.model._name)
+
     def _import_record(self, external_id, **kwargs):
         """
         Delay the import of the records.
@@ -537,20 +1189,114 @@ class DelayedBatchImporter(AbstractComponent):
         :param external_id: The external ID of the record to be imported.
         :param kwargs: Additional keyword arguments for configuring the delayed import.
         """
-        priority = kwargs.pop("priority", None)
-        eta = kwargs.pop("eta", None)
-        max_retries = kwargs.pop("max_retries", None)
-        description = kwargs.pop("description", None)
-        channel = kwargs.pop("channel", None)
-        identity_key = kwargs.pop("identity_key", None)
-
-        self.env[self.model._name].with_delay(
-            priority=priority,
-            eta=eta,
-            max_retries=max_retries,
-            description=description,
-            channel=channel,
-            identity_key=identity_key,
-        ).import_record(
-            backend=self.backend_record, pos_id=external_id, **kwargs
-        )
\ No newline at end of file
+        self._delay(
+            self.env[self.model._name],
+            "import_record",
+            backend=self.backend_record,
+            pos_id=external_id,
+            **kwargs
+        )
+
+
+class ChunkedBatchImporter(AbstractComponent):
+    """
+    Batch importer delaying one job per page of records.
+
+    Instead of one job per record, each page of records already fetched
+    from Pos is imported by a single `import_records` job. It avoids the
+    per-job overhead (transaction, environment, component lookup) which
+    dominates the import of small records like partners or categories.
+
+    :ivar _name: Name of the component.
+    :vartype _name: str
+    :ivar _inherit: Inherited component.
+    :vartype _inherit: str
+    """
+
+    _name = "pos.chunked.batch.importer"
+    _inherit = "pos.delayed.batch.importer"
+    _model_name = None
+
+    def _import_page(self, records, **kwargs):
+        """
+        Delay the import of all the records of a page in one job.
+
+        :param records: The records of the page.
+        :type records: list
+        :param kwargs: Additional keyword arguments for configuring the delayed import.
+        :return: The list of record IDs processed in this page.
+        :rtype: list
+        """
+        if records:
+            self._delay(
+                self.env[self.model._name],
+                "import_records",
+                backend=self.backend_record,
+                records=records,
+                **kwargs
+            )
+        return [record["id"] for record in records]
+
+
+class ChunkImporter(Component):
+    """
+    Import a chunk of Pos records within one job.
+
+    Each record is imported in its own savepoint, so a failing record does
+    not roll back the others. The failing records are delayed again as
+    individual `import_record` jobs, to be retried on their own.
+    """
+
+    _name = "pos.chunk.importer"
+    _inherit = ["base.importer", "base.pos.connector"]
+    _usage = "chunk.importer"
+
+    def run(self, records, **kwargs):
+        """
+        Import the records.
+
+        :param records: The records fetched from Pos.
+        :type records: list
+        :param kwargs: Additional keyword arguments passed to the record importer.
+        :return: A summary of the import.
+        :rtype: str
+        """
+        # Lock all the records at once, the ones locked by another job are
+        # delayed in their own job
+        lock_manager = self.component(usage="import.lock.manager")
+        __, busy = lock_manager.try_acquire([record["id"] for record in records])
+        failures = []
+        for record in records:
+            if record["id"] in busy:
+                failures.append(record["id"])
+                self._delay_failed_record(record, **kwargs)
+                continue
+            try:
+                with lock_manager.savepoint():
+                    importer = self.component(usage="record.importer")
+                    importer.run(record, **kwargs)
+            except Exception as err:
+                _logger.info(
+                    "Import of %s %s failed, delayed in its own job: %s",
+                    self.model._name,
+                    record["id"],
+                    err,
+                )
+                failures.append(record["id"])
+                self._delay_failed_record(record, **kwargs)
+        return _("%d records imported, %d delayed in their own job: %s") % (
+            len(records) - len(failures),
+            len(failures),
+            failures,
+        )
+
+    def _delay_failed_record(self, record, **kwargs):
+        """
+        Delay the import of a record which failed in the chunk.
+
+        :param record: The record fetched from Pos.
+        :type record: dict
+        """
+        self.model.with_delay(
+            description=_("Retry import of %s %s") % (self.model._name, record["id"]),
+        ).import_record(backend=self.backend_record, pos_id=record["id"], **kwargs)
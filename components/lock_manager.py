@@ -0,0 +1,156 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+import hashlib
+import logging
+import struct
+import threading
+from contextlib import contextmanager
+
+from odoo.addons.component.core import Component
+from odoo.addons.queue_job.exception import RetryableJobError
+
+from .binder import binder_index_savepoint
+from .importer import RETRY_ON_ADVISORY_LOCK
+
+_logger = logging.getLogger(__name__)
+
+
+class PosLockStats:
+    """Contention statistics of the import locks, per binding model.
+
+    The statistics are kept for the lifetime of the worker process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def add(self, model_name, acquired, busy):
+        with self._lock:
+            stats = self._stats.setdefault(model_name, {"acquired": 0, "busy": 0})
+            stats["acquired"] += acquired
+            stats["busy"] += busy
+            return dict(stats)
+
+    def get(self, model_name=None):
+        with self._lock:
+            if model_name is not None:
+                return dict(self._stats.get(model_name, {"acquired": 0, "busy": 0}))
+            return {model: dict(stats) for model, stats in self._stats.items()}
+
+
+lock_stats = PosLockStats()
+
+
+class PosImportLockManager(Component):
+    """Take the advisory locks of the imports for many records at once.
+
+    The lock names are the ones used by the record importers, hashed the
+    same way as ``pg_try_advisory_lock`` of the connector, so a batch lock
+    and a record lock on the same record exclude each other. The locks
+    taken in the current job are remembered in the ``held_import_locks``
+    set given to ``pos.backend.work_on``, a record importer does not lock
+    again a record locked by the batch.
+    """
+
+    _name = "pos.import.lock.manager"
+    _inherit = "base.pos.connector"
+    _usage = "import.lock.manager"
+
+    def _lock_name(self, pos_id):
+        return "import({}, {}, {}, {})".format(
+            self.backend_record._name,
+            self.backend_record.id,
+            self.model._name,
+            pos_id,
+        )
+
+    @staticmethod
+    def _lock_key(lock_name):
+        hasher = hashlib.sha1(str(lock_name).encode())
+        return struct.unpack("q", hasher.digest()[:8])[0]
+
+    def _held_locks(self):
+        """Return the keys of the locks taken in the current job"""
+        held = getattr(self.work, "held_import_locks", None)
+        if held is None:
+            # work context not opened by the backend, the locks are only
+            # remembered in this work context
+            held = self.work.held_import_locks = set()
+        return held
+
+    def try_acquire(self, pos_ids):
+        """
+        Try to lock the import of the records until the end of the transaction.
+
+        All the locks are requested with a single query.
+
+        :param pos_ids: The IDs of the records on Pos.
+        :type pos_ids: list
+        :return: The IDs of the records locked and the IDs of the records
+                 already locked by another transaction.
+        :rtype: tuple(list, list)
+        """
+        held = self._held_locks()
+        keys = {pos_id: self._lock_key(self._lock_name(pos_id)) for pos_id in pos_ids}
+        to_lock = list({key for key in keys.values() if key not in held})
+        if to_lock:
+            self.env.cr.execute(
+                "SELECT key, pg_try_advisory_xact_lock(key) "
+                "FROM unnest(%s::bigint[]) AS key",
+                (to_lock,),
+            )
+            held.update(key for key, acquired in self.env.cr.fetchall() if acquired)
+
+        acquired = [pos_id for pos_id, key in keys.items() if key in held]
+        busy = [pos_id for pos_id, key in keys.items() if key not in held]
+        stats = lock_stats.add(self.model._name, len(acquired), len(busy))
+        if busy:
+            _logger.info(
+                "%d %s records locked by another transaction "
+                "(%d locked, %d busy since startup)",
+                len(busy),
+                self.model._name,
+                stats["acquired"],
+                stats["busy"],
+            )
+        return acquired, busy
+
+    @contextmanager
+    def savepoint(self):
+        """
+        Context manager: run the block in a savepoint.
+
+        The locks taken in a savepoint which is rolled back are released
+        by PostgreSQL, they are forgotten by the job as well. The bindings
+        created in the savepoint are dropped from the binder index.
+        """
+        held = self._held_locks()
+        held_before = set(held)
+        try:
+            with binder_index_savepoint(self.work):
+                yield
+        except Exception:
+            held.intersection_update(held_before)
+            raise
+
+    def is_held(self, pos_id):
+        """Return True if the import of the record is locked by the current job"""
+        return self._lock_key(self._lock_name(pos_id)) in self._held_locks()
+
+    def acquire_or_retry(self, pos_id, retry_seconds=RETRY_ON_ADVISORY_LOCK):
+        """
+        Lock the import of a record or retry the job later.
+
+        :param pos_id: The ID of the record on Pos.
+        :raises RetryableJobError: If the record is locked by another transaction.
+        """
+        if self.is_held(pos_id):
+            return
+        __, busy = self.try_acquire([pos_id])
+        if busy:
+            raise RetryableJobError(
+                "Could not acquire advisory lock",
+                seconds=retry_seconds,
+                ignore_retry=True,
+            )
@@ -3,6 +3,8 @@
 from odoo.addons.component.core import AbstractComponent
 from odoo.addons.connector.components.mapper import mapping
 
+from ..utils.code import like_escape
+
 
 class PosImportMapper(AbstractComponent):
     """
@@ -38,6 +40,42 @@ class PosImportMapper(AbstractComponent):
         """
         return {"backend_id": self.backend_record.id}
 
+    def _get_taken_codes(self, model_name, field, prefix, binding_model=None):
+        """
+        Return the codes starting with `prefix` used in the company.
+
+        All the codes are fetched with a single ``LIKE`` query. When a
+        binding model is given, a code is taken only if the first record
+        using it is not bound on the backend yet.
+
+        :param model_name: The model holding the codes.
+        :type model_name: str
+        :param field: The field holding the codes.
+        :type field: str
+        :param prefix: The beginning of the codes.
+        :type prefix: str
+        :param binding_model: The binding model of `model_name`.
+        :type binding_model: str
+        :return: The codes taken.
+        :rtype: set
+        """
+        records = self.env[model_name].with_context(active_test=False).search(
+            [
+                (field, "=like", like_escape(prefix) + "%"),
+                ("company_id", "=", self.backend_record.company_id.id),
+            ]
+        )
+        first_records = {}
+        for record in records:
+            first_records.setdefault(record[field], record)
+        if binding_model is None:
+            return set(first_records)
+        first = self.env[model_name].browse([r.id for r in first_records.values()])
+        external_ids = self.binder_for(binding_model).to_external_many(first, wrap=True)
+        return {
+            code for code, record in first_records.items() if not external_ids[record.id]
+        }
+
 class PosExportMapper(AbstractComponent):
     """
     Mapper component for exporting data from the Point of Sale (POS) module.
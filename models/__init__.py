@@ -6,6 +6,9 @@ from . import account_payment_mode
 from . import account_tax
 from . import account_tax_group
 from . import pos_backend
+from . import pos_import_state
+from . import pos_payload
+from . import pos_quantity_outbox
 from . import product_category
 from . import product_image
 from . import product_pricelist
@@ -15,4 +18,6 @@ from . import queue_job
 from . import res_partner
 from . import sale_order
 from . import sale_order_state
-from . import stock_immediate_transfer
\ No newline at end of file
+from . import stock_immediate_transfer
+from . import stock_location
+from . import stock_quant
\ No newline at end of file
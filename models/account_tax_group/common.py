@@ -1,6 +1,6 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
 
-from odoo import fields, models
+from odoo import api, fields, models
 
 from odoo.addons.component.core import Component
 
@@ -42,6 +42,20 @@ class PosAccountTaxGroup(models.Model):
         ondelete="cascade",
     )
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        # Clear the taxes of the tax groups cached by the backends
+        self.env["pos.backend"].clear_caches()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self.env["pos.backend"].clear_caches()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env["pos.backend"].clear_caches()
+        return super().unlink()
+
 
 class TaxGroupAdapter(Component):
     _name = "pos.account.tax.group.adapter"
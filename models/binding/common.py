@@ -50,6 +50,8 @@ class PosBinding(models.AbstractModel):
     Raises `RetryableJobError` if it is inactive.
     - `import_record`: Imports a record from the POS system based on the given 
     POS backend and POS ID.
+    - `import_records`: Imports a chunk of records already fetched from the
+    POS system, each one in its own savepoint.
     - `import_batch`: Prepares a batch import of records from the POS system 
     based on the given POS backend and optional filters.
     - `export_record`: Exports a record to the POS system.
@@ -109,6 +111,21 @@ class PosBinding(models.AbstractModel):
             importer = work.component(usage="record.importer")
             return importer.run(pos_id, force=force)
 
+    @api.model
+    def import_records(self, backend, records, **kwargs):
+        """
+        Import a chunk of records already fetched from Pos.
+
+        :param backend: Pos backend record
+        :param records: List of the records data fetched from Pos
+        :param kwargs: Additional keyword arguments
+        :return: Summary of the import
+        """
+        self.check_active(backend)
+        with backend.work_on(self._name) as work:
+            importer = work.component(usage="chunk.importer")
+            return importer.run(records, **kwargs)
+
     @api.model
     def import_batch(self, backend, filters=None, **kwargs):
         """
@@ -1,13 +1,19 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
 import logging
+from contextlib import contextmanager
 
-from odoo import _, api, exceptions, fields, models
+from odoo import _, api, exceptions, fields, models, tools
 
 from odoo.addons.base.models.res_partner import _tz_get
 from odoo.addons.component.core import Component
 
-from ...components.backend_adapter import api_handle_errors
+from ...components.backend_adapter import (
+    PosRecordCache,
+    api_handle_errors,
+    client_pool,
+)
+from ...components.binder import PosBinderIndex
 
 _logger = logging.getLogger(__name__)
 
@@ -161,6 +167,71 @@ class PosBackend(models.Model):
 
     verbose = fields.Boolean(help="Output requests details in the logs")
     debug = fields.Boolean(help="Activate Pos's webservice debug mode")
+    connection_pool_size = fields.Integer(
+        string="Connection pool size",
+        help="Maximum number of keep-alive connections kept open "
+        "to the Pos webservice by each worker process.",
+        default=10,
+    )
+    connection_idle_timeout = fields.Integer(
+        string="Connection idle timeout (seconds)",
+        help="Close the pooled connections after this many seconds "
+        "without requests. 0 keeps them open until the worker stops.",
+        default=300,
+    )
+    import_state_ids = fields.One2many(
+        comodel_name="pos.import.state",
+        inverse_name="backend_id",
+        string="Import settings per model",
+    )
+    import_concurrency_check = fields.Selection(
+        selection=[
+            ("constraint", "Unique constraint"),
+            ("new_cursor", "New transaction"),
+        ],
+        string="Concurrent imports check",
+        help="How the imports detect that a new record has been imported "
+        "by a concurrent job. 'Unique constraint' relies on the unique Pos "
+        "ID of the bindings, 'New transaction' checks it in a new database "
+        "transaction before each import. Categories and product options are "
+        "always checked in a new transaction.",
+        default="constraint",
+        required=True,
+    )
+    direct_import_workers = fields.Integer(
+        string="Direct import workers",
+        help="Number of records imported at the same time by the imports "
+        "run from the user interface, each one in its own transaction. "
+        "The transactions are committed in the order of the records and the "
+        "import stops at the first failed record. "
+        "1 imports them one after the other in the current transaction.",
+        default=1,
+    )
+    payload_ttl = fields.Integer(
+        string="Payload time to live (hours)",
+        help="Records fetched by the batch imports are stored for the import "
+        "jobs during this time. Jobs running later fetch them from Pos again.",
+        default=48,
+    )
+    stock_export_chunk_size = fields.Integer(
+        string="Stock export chunk size",
+        help="Number of variant quantities pushed to Pos by each stock "
+        "export job.",
+        default=200,
+    )
+    stock_export_debounce = fields.Integer(
+        string="Stock export debounce (seconds)",
+        help="Changed quantities wait this long before being pushed to Pos, "
+        "the last quantity of a product changed several times in the "
+        "meantime is pushed once.",
+        default=60,
+    )
+    import_page_concurrency = fields.Integer(
+        string="Concurrent page requests",
+        help="Number of pages of records requested at the same time "
+        "by the batch imports. 1 requests the pages one after the other.",
+        default=1,
+    )
 
     matching_product_template = fields.Boolean(string="Match product template")
 
@@ -230,6 +301,161 @@ class PosBackend(models.Model):
         if self.import_refresh_data_interval_time == 0:
             raise exceptions.UserError(_('Import refresh data interval time must be larger than 0.'))
 
+    @api.constrains("connection_pool_size", "connection_idle_timeout")
+    def _check_connection_pool(self):
+        for backend in self:
+            if backend.connection_pool_size < 1:
+                raise exceptions.UserError(_("Connection pool size must be larger than 0."))
+            if backend.connection_idle_timeout < 0:
+                raise exceptions.UserError(_("Connection idle timeout cannot be negative."))
+
+    @api.constrains("import_page_concurrency")
+    def _check_import_page_concurrency(self):
+        for backend in self:
+            if backend.import_page_concurrency < 1:
+                raise exceptions.UserError(_("Concurrent page requests must be larger than 0."))
+
+    @api.constrains("direct_import_workers")
+    def _check_direct_import_workers(self):
+        for backend in self:
+            if backend.direct_import_workers < 1:
+                raise exceptions.UserError(_("Direct import workers must be larger than 0."))
+
+    @api.constrains("stock_export_chunk_size")
+    def _check_stock_export_chunk_size(self):
+        for backend in self:
+            if backend.stock_export_chunk_size < 1:
+                raise exceptions.UserError(
+                    _("Stock export chunk size must be larger than 0.")
+                )
+
+    @api.constrains("stock_export_debounce")
+    def _check_stock_export_debounce(self):
+        for backend in self:
+            if backend.stock_export_debounce < 0:
+                raise exceptions.UserError(
+                    _("Stock export debounce must be positive.")
+                )
+
+    def _get_client_pool_fields(self):
+        """Fields which require new webservice clients when modified"""
+        return (
+            "location",
+            "webservice_key",
+            "debug",
+            "connection_pool_size",
+            "connection_idle_timeout",
+        )
+
+    def write(self, vals):
+        res = super().write(vals)
+        if set(vals).intersection(self._get_client_pool_fields()):
+            client_pool.invalidate(self.ids)
+        if "taxes_included" in vals:
+            self.clear_caches()
+        if set(vals).intersection(self._get_stock_quantity_fields()):
+            self.clear_caches()
+            self._invalidate_stock_quantities()
+        return res
+
+    @tools.ormcache("self.id", "pos_tax_group_id")
+    def _get_pos_tax_group_taxes(self, pos_tax_group_id):
+        """
+        Return the taxes of a Pos tax group, cached per backend.
+
+        The cache is cleared when the tax group bindings or the taxes
+        are modified.
+
+        :param pos_tax_group_id: The ID of the tax group on Pos.
+        :return: The IDs of the taxes, None if the tax group is not imported.
+        :rtype: tuple | None
+        """
+        binding = (
+            self.env["pos.account.tax.group"]
+            .sudo()
+            .with_context(active_test=False)
+            .search(
+                [("backend_id", "=", self.id), ("pos_id", "=", pos_tax_group_id)],
+                limit=1,
+            )
+        )
+        if not binding:
+            return None
+        return tuple(binding.tax_ids.ids)
+
+    @tools.ormcache("self.id", "tax_id")
+    def _get_tax_price_factor(self, tax_id):
+        """
+        Return the factor converting a Pos price to an Odoo price for a tax.
+
+        A Pos price without taxes is converted to a price with taxes when
+        the tax is included in the price, the other prices are kept.
+
+        :param tax_id: The ID of the tax, False for no tax.
+        :rtype: float
+        """
+        tax = self.env["account.tax"].sudo().browse(tax_id)
+        if tax and not self.taxes_included and tax.price_include:
+            return 1 + tax.amount / 100
+        return 1.0
+
+    def _get_import_state(self, model_name):
+        """
+        Return the batch import settings of a binding model, created on first use.
+
+        :param model_name: The name of the binding model, like `pos.sale.order`.
+        :type model_name: str
+        :return: The import state of the model for this backend.
+        :rtype: recordset of pos.import.state
+        """
+        self.ensure_one()
+        state_model = self.env["pos.import.state"].sudo()
+        state = state_model.search(
+            [("backend_id", "=", self.id), ("model_name", "=", model_name)],
+            limit=1,
+        )
+        if not state:
+            state = state_model.create({"backend_id": self.id, "model_name": model_name})
+        return state
+
+    @contextmanager
+    def work_on(self, model_name, **kwargs):
+        """
+        Open a work context with a cache of the records read on Pos and an
+        index of the bindings.
+
+        The :class:`PosRecordCache` and :class:`PosBinderIndex` are
+        propagated to every component and child work context, so the same
+        Pos record is fetched only once per job and the binders look the
+        Pos ids up in memory. So are the import locks held by the job and
+        the index of the product matcher. They are discarded when the work
+        context is closed.
+
+        The webservice client of the backend is kept in use until then, so
+        it is not closed as idle while the job still uses it.
+        """
+        cache = kwargs.setdefault("pos_record_cache", PosRecordCache())
+        index = kwargs.setdefault("binder_index", PosBinderIndex())
+        # the import locks held and the products matched by the job
+        kwargs.setdefault("held_import_locks", set())
+        kwargs.setdefault("product_match_index", {})
+        with client_pool.use(self), super().work_on(model_name, **kwargs) as work:
+            yield work
+        if index.hits or index.misses:
+            _logger.debug(
+                "Binder index for %s: %d hits, %d misses",
+                model_name,
+                index.hits,
+                index.misses,
+            )
+        if cache.hits or cache.misses:
+            _logger.debug(
+                "Pos record cache for %s: %d hits, %d misses",
+                model_name,
+                cache.hits,
+                cache.misses,
+            )
+
     @api.constrains("product_qty_field")
     def check_product_qty_field_dependencies_installed(self):
         """
@@ -787,7 +1013,26 @@ class PosBackend(models.Model):
         :raise: UserError if no internal location is found.
         """
         root_location = self.stock_location_id or self.warehouse_id.lot_stock_id
-        locations = self.env["stock.location"].search(
+        return self.env["stock.location"].browse(
+            self._get_location_ids_for_stock_quantities(root_location.id)
+        )
+
+    @tools.ormcache("self.id", "root_location_id")
+    def _get_location_ids_for_stock_quantities(self, root_location_id):
+        """
+        Return the IDs of the locations of :meth:`_get_locations_for_stock_quantities`,
+        cached per backend and root location.
+
+        The cache is cleared when the locations or the stock configuration
+        of the backend are modified.
+
+        :param root_location_id: The ID of the root location of the backend.
+        :rtype: tuple
+        :raise: UserError if no internal location is found.
+        """
+        location_model = self.env["stock.location"].sudo()
+        root_location = location_model.browse(root_location_id)
+        locations = location_model.search(
             [
                 ("id", "child_of", root_location.id),
                 ("pos_synchronized", "=", True),
@@ -797,7 +1042,7 @@ class PosBackend(models.Model):
         # if we choosed a location but none where flagged
         # 'pos_synchronized', consider we want all of them in the tree
         if not locations:
-            locations = self.env["stock.location"].search(
+            locations = location_model.search(
                 [
                     ("id", "child_of", root_location.id),
                     ("usage", "=", "internal"),
@@ -810,7 +1055,60 @@ class PosBackend(models.Model):
             raise exceptions.UserError(
                 _("No internal location found to compute the product quantity.")
             )
-        return locations
+        return tuple(locations.ids)
+
+    def _get_stock_quantity_fields(self):
+        """Fields which change the quantities to push to Pos"""
+        return ("warehouse_id", "stock_location_id", "product_qty_field")
+
+    @api.model
+    def _invalidate_stock_quantities(self):
+        """Forget the quantities computed in the current transaction"""
+        self.env.cr.cache.pop("pos_stock_quantities", None)
+
+    def _get_stock_quantity_cache(self):
+        cache = self.env.cr.cache.get("pos_stock_quantities")
+        if cache is None:
+            cache = self.env.cr.cache["pos_stock_quantities"] = {}
+            # the quantities are only valid in the current transaction
+            self.env.cr.postcommit.add(self._invalidate_stock_quantities)
+            self.env.cr.postrollback.add(self._invalidate_stock_quantities)
+        return cache.setdefault(self.id, {})
+
+    def _get_stock_quantities(self, products):
+        """
+        Return the quantities of products to push to Pos.
+
+        The quantities are read with one grouped query on the quants of the
+        backend locations, according to the `product_qty_field` of the
+        backend. They are kept for the transaction, until a quant or the
+        stock configuration of the backend is modified.
+
+        :param products: The products (``product.product``).
+        :type products: recordset
+        :return: The quantities by product id, negative when more is
+                 reserved or delivered than available.
+        :rtype: dict
+        """
+        self.ensure_one()
+        quantities = self._get_stock_quantity_cache()
+        missing = [pid for pid in products.ids if pid not in quantities]
+        if missing:
+            locations = self._get_locations_for_stock_quantities()
+            quant_fields = ["product_id", "quantity"]
+            if self.product_qty_field == "qty_available_not_res":
+                quant_fields.append("reserved_quantity")
+            groups = self.env["stock.quant"].read_group(
+                [("product_id", "in", missing), ("location_id", "in", locations.ids)],
+                quant_fields,
+                ["product_id"],
+                lazy=False,
+            )
+            quantities.update(dict.fromkeys(missing, 0.0))
+            for group in groups:
+                qty = group["quantity"] - group.get("reserved_quantity", 0.0)
+                quantities[group["product_id"][0]] = qty
+        return {pid: quantities[pid] for pid in products.ids}
 
 
 class NoModelAdapter(Component):
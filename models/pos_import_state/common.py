@@ -0,0 +1,207 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from datetime import timedelta
+
+import pytz
+
+from odoo import _, api, exceptions, fields, models
+
+from ...utils.datetime import parse_date_string
+
+
+class PosImportState(models.Model):
+    """
+    The `PosImportState` class keeps the batch import settings and progress
+    of one binding model for a POS backend.
+
+    Fields:
+    - `backend_id`: The POS backend the settings belong to.
+    - `model_name`: The binding model imported, such as `pos.sale.order`.
+    - `page_size`: The number of records requested per page.
+    - `pagination`: Either page numbers or a cursor on `(updated_at, id)`.
+    - `cursor_updated_at`, `cursor_id`: The last record imported in cursor
+    mode, the next import resumes right after it.
+    - `adaptive_page_size`: Whether the page size is adapted to the observed
+    response time and payload size, between `page_size_min` and `page_size_max`.
+    - `high_water_mark`: The highest `updated_at` of the records seen by the
+    last complete import, the next import starts from it minus `overlap`.
+    """
+    _name = "pos.import.state"
+    _description = "Pos Import State"
+    _rec_name = "model_name"
+
+    backend_id = fields.Many2one(
+        comodel_name="pos.backend",
+        string="Pos Backend",
+        required=True,
+        ondelete="cascade",
+    )
+    model_name = fields.Char(string="Binding Model", required=True)
+    page_size = fields.Integer(
+        string="Page size",
+        help="Number of records requested per page.",
+        default=100,
+    )
+    pagination = fields.Selection(
+        selection=[
+            ("page", "Page number"),
+            ("cursor", "Cursor (updated at, id)"),
+        ],
+        string="Pagination",
+        help="Page number pagination gets slower on deep pages and can miss "
+        "or duplicate records written during the import. The cursor "
+        "pagination requests the records after the last one imported, "
+        "Pos must support sorting and filtering the records after a cursor. "
+        "The import falls back to page numbers when the cursor does not move.",
+        default="page",
+        required=True,
+    )
+    adaptive_page_size = fields.Boolean(
+        string="Adaptive page size",
+        help="Grow the page size while the pages are fast and small enough, "
+        "halve it when a page is too slow or too large. The chosen size is "
+        "kept for the next import.",
+    )
+    page_size_min = fields.Integer(string="Minimum page size", default=10)
+    page_size_max = fields.Integer(string="Maximum page size", default=1000)
+    page_size_step = fields.Integer(
+        string="Page size step",
+        help="Number of records added to the page size after a fast page.",
+        default=50,
+    )
+    page_time_target = fields.Float(
+        string="Target page time (seconds)",
+        help="Pages answered slower than this shrink the page size.",
+        default=5.0,
+    )
+    page_payload_max = fields.Integer(
+        string="Maximum page payload (KB)",
+        help="Pages larger than this shrink the page size.",
+        default=2048,
+    )
+    cursor_updated_at = fields.Char(string="Cursor updated at", readonly=True)
+    cursor_id = fields.Integer(string="Cursor ID", readonly=True)
+    high_water_mark = fields.Datetime(
+        string="Imported up to",
+        help="Highest update date on Pos of the records seen by the last "
+        "complete import.",
+        readonly=True,
+    )
+    overlap = fields.Integer(
+        string="Overlap (seconds)",
+        help="The next import also requests the records updated during this "
+        "time before the last update seen, to catch the records written "
+        "on Pos while the last import was running.",
+        default=60,
+    )
+
+    _sql_constraints = [
+        (
+            "model_uniq",
+            "unique(backend_id, model_name)",
+            "The import state of a model must be unique per backend.",
+        ),
+    ]
+
+    @api.constrains("page_size", "page_size_min", "page_size_max")
+    def _check_page_size(self):
+        for state in self:
+            if state.page_size < 1:
+                raise exceptions.UserError(_("Page size must be larger than 0."))
+            if not 0 < state.page_size_min <= state.page_size_max:
+                raise exceptions.UserError(
+                    _("Minimum page size must be larger than 0 and lower than the maximum.")
+                )
+
+    def compute_next_page_size(self, page_size, nb_records, elapsed, payload_size):
+        """
+        Return the page size to request next (additive increase,
+        multiplicative decrease).
+
+        :param page_size: The page size requested for the observed page.
+        :param nb_records: The number of records returned.
+        :param elapsed: The response time of the page, in seconds.
+        :param payload_size: The size of the records returned, in bytes.
+        :return: The next page size, within the configured bounds.
+        :rtype: int
+        """
+        self.ensure_one()
+        if elapsed > self.page_time_target or payload_size > self.page_payload_max * 1024:
+            page_size = page_size // 2
+        elif nb_records >= page_size:
+            # Only grow on full pages, a short page says nothing about
+            # the cost of a larger one
+            page_size += self.page_size_step
+        return max(self.page_size_min, min(self.page_size_max, page_size))
+
+    def get_cursor(self):
+        """
+        Return the cursor of the last record imported.
+
+        :return: A `(updated_at, id)` tuple or None when no record was imported.
+        :rtype: tuple or None
+        """
+        self.ensure_one()
+        if not self.cursor_id:
+            return None
+        return (self.cursor_updated_at, self.cursor_id)
+
+    def set_cursor(self, updated_at, record_id):
+        """
+        Store the cursor of the last record imported.
+
+        :param updated_at: The `updated_at` value of the record on Pos.
+        :param record_id: The ID of the record on Pos.
+        """
+        self.ensure_one()
+        self.write({"cursor_updated_at": updated_at, "cursor_id": int(record_id)})
+
+    @api.model
+    def parse_updated_at(self, updated_at):
+        """
+        Convert an `updated_at` value of Pos to a naive UTC datetime.
+
+        :return: The datetime or None if `updated_at` is empty.
+        """
+        if not updated_at or updated_at == "0000-00-00 00:00:00":
+            return None
+        value = parse_date_string(str(updated_at))
+        if value.tzinfo:
+            value = value.astimezone(pytz.utc).replace(tzinfo=None)
+        return value
+
+    def get_since_date(self, since_date=None):
+        """
+        Return the date from which the records must be imported.
+
+        :param since_date: The date requested by the caller, like the
+                           "Import since" date of the backend.
+        :return: The earliest of `since_date` and the high-water mark minus
+                 the overlap, None when there is neither.
+        :rtype: datetime or None
+        """
+        self.ensure_one()
+        since_date = fields.Datetime.to_datetime(since_date) or None
+        if not self.high_water_mark:
+            return since_date
+        hwm_date = self.high_water_mark - timedelta(seconds=self.overlap)
+        if since_date and since_date < hwm_date:
+            # an earlier date has been requested, re-import from there
+            return since_date
+        return hwm_date
+
+    def update_high_water_mark(self, updated_at):
+        """
+        Move the high-water mark forward to `updated_at`.
+
+        It never moves backwards, so replaying an import is harmless.
+
+        :param updated_at: The highest update date seen.
+        :type updated_at: datetime
+        """
+        self.ensure_one()
+        if updated_at and (not self.high_water_mark or updated_at > self.high_water_mark):
+            self.high_water_mark = updated_at
+
+    def button_reset_cursor(self):
+        self.write({"cursor_updated_at": False, "cursor_id": 0})
@@ -0,0 +1,119 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+import base64
+import hashlib
+import json
+import logging
+import zlib
+from datetime import timedelta
+
+import psycopg2
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class PosPayload(models.Model):
+    """
+    The `PosPayload` class stores the records already fetched from Pos,
+    so the delayed import jobs only carry a small reference to them.
+
+    The payloads are compressed and addressed by the SHA-256 of their
+    content: the same record listed twice is stored once. They expire
+    after the time to live configured on the backend, a job resolving an
+    expired payload fetches the record from Pos again.
+
+    Fields:
+    - `name`: The SHA-256 of the normalized record, used as reference.
+    - `data`: The zlib compressed JSON of the record.
+    - `expire_at`: The date after which the payload can be removed.
+    """
+    _name = "pos.payload"
+    _description = "Pos Record Payload"
+
+    name = fields.Char(string="Reference", required=True, index=True, readonly=True)
+    data = fields.Binary(string="Compressed data", attachment=False, readonly=True)
+    expire_at = fields.Datetime(string="Expire at", required=True, index=True)
+
+    _sql_constraints = [
+        ("name_uniq", "unique(name)", "A payload with the same reference already exists."),
+    ]
+
+    @api.model
+    def _serialize(self, record):
+        return json.dumps(record, sort_keys=True, default=str).encode()
+
+    @api.model
+    def store_many(self, records, ttl_hours):
+        """
+        Store the records and return their references.
+
+        :param records: The records fetched from Pos.
+        :type records: list
+        :param ttl_hours: The number of hours the payloads are kept.
+        :type ttl_hours: int
+        :return: The reference of each record, in the same order.
+        :rtype: list
+        """
+        expire_at = fields.Datetime.now() + timedelta(hours=ttl_hours)
+        contents = {}
+        refs = []
+        for record in records:
+            content = self._serialize(record)
+            ref = hashlib.sha256(content).hexdigest()
+            contents[ref] = content
+            refs.append(ref)
+        if not contents:
+            return refs
+        # Concurrent batches may store the same payloads: the existing ones
+        # only have their expiration date extended
+        self.flush()
+        self.env.cr.execute(
+            """
+            INSERT INTO pos_payload
+                (name, data, expire_at,
+                 create_uid, create_date, write_uid, write_date)
+            SELECT name, data, %(expire_at)s,
+                   %(uid)s, now() at time zone 'UTC',
+                   %(uid)s, now() at time zone 'UTC'
+            FROM unnest(%(names)s::varchar[], %(datas)s::bytea[]) AS p(name, data)
+            ON CONFLICT (name) DO UPDATE
+            SET expire_at = EXCLUDED.expire_at,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+            """,
+            {
+                "expire_at": expire_at,
+                "uid": self.env.uid,
+                "names": list(contents),
+                "datas": [
+                    psycopg2.Binary(base64.b64encode(zlib.compress(content)))
+                    for content in contents.values()
+                ],
+            },
+        )
+        self.invalidate_cache()
+        return refs
+
+    @api.model
+    def load(self, ref):
+        """
+        Return the record stored under `ref`.
+
+        :param ref: The reference returned by :meth:`store_many`.
+        :type ref: str
+        :return: The record or None if the payload expired.
+        :rtype: dict or None
+        """
+        payload = self.sudo().search([("name", "=", ref)], limit=1)
+        if not payload or not payload.data:
+            return None
+        return json.loads(zlib.decompress(base64.b64decode(payload.data)))
+
+    @api.model
+    def _scheduler_vacuum(self):
+        """Remove the expired payloads"""
+        expired = self.sudo().search([("expire_at", "<", fields.Datetime.now())])
+        _logger.debug("%d expired Pos payloads removed", len(expired))
+        expired.unlink()
@@ -0,0 +1,149 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+import logging
+from collections import defaultdict
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+
+class PosQuantityOutbox(models.Model):
+    """
+    The `PosQuantityOutbox` class holds the quantities waiting to be pushed
+    to Pos, at most one per backend and barcode.
+
+    Queuing the quantity of a barcode which is already waiting replaces
+    its quantity, so only the latest one is pushed. The entries are pushed
+    by a scheduled action once they waited for the debounce window of
+    their backend, which bounds the pushes to one per barcode and window.
+
+    Fields:
+    - `backend_id`: The Pos backend to push the quantity to.
+    - `barcode`: The Pos barcode of the variant.
+    - `quantity`: The latest quantity to push.
+    - `queued_at`: The date the barcode was queued since its last push.
+    """
+    _name = "pos.quantity.outbox"
+    _description = "Pos Quantity Outbox"
+
+    backend_id = fields.Many2one(
+        comodel_name="pos.backend",
+        string="Pos Backend",
+        required=True,
+        ondelete="cascade",
+        readonly=True,
+    )
+    barcode = fields.Char(string="Barcode", required=True, readonly=True)
+    quantity = fields.Float(string="Quantity", readonly=True)
+    queued_at = fields.Datetime(string="Queued at", required=True, index=True)
+
+    _sql_constraints = [
+        (
+            "backend_barcode_uniq",
+            "unique(backend_id, barcode)",
+            "A quantity is already waiting for this barcode.",
+        ),
+    ]
+
+    @api.model
+    def enqueue(self, backend, quantities):
+        """
+        Queue quantities to push, replacing the waiting ones of the same
+        barcodes.
+
+        :param backend: The Pos backend.
+        :param quantities: The quantities, by barcode.
+        :type quantities: dict
+        """
+        quantities = {
+            barcode: qty for barcode, qty in quantities.items() if barcode
+        }
+        if not quantities:
+            return
+        # make sure the pending ORM writes are in the database
+        self.flush()
+        self.env.cr.execute(
+            """
+            INSERT INTO pos_quantity_outbox
+                (backend_id, barcode, quantity, queued_at,
+                 create_uid, create_date, write_uid, write_date)
+            SELECT %(backend_id)s, barcode, quantity, now() at time zone 'UTC',
+                   %(uid)s, now() at time zone 'UTC',
+                   %(uid)s, now() at time zone 'UTC'
+            FROM unnest(%(barcodes)s::varchar[], %(quantities)s::float8[])
+                AS q(barcode, quantity)
+            ON CONFLICT (backend_id, barcode) DO UPDATE
+            SET quantity = EXCLUDED.quantity,
+                write_uid = EXCLUDED.write_uid,
+                write_date = EXCLUDED.write_date
+            """,
+            {
+                "backend_id": backend.id,
+                "uid": self.env.uid,
+                "barcodes": list(quantities),
+                "quantities": list(quantities.values()),
+            },
+        )
+        self.invalidate_cache()
+
+    @api.model
+    def _pop_due(self):
+        """
+        Remove the entries which waited for the debounce window of their
+        backend and return them. Entries being popped by another
+        transaction are skipped.
+
+        :return: ``(barcode, quantity)`` tuples, by backend id.
+        :rtype: dict
+        """
+        self.flush()
+        self.env.cr.execute(
+            """
+            DELETE FROM pos_quantity_outbox
+            WHERE id IN (
+                SELECT o.id
+                FROM pos_quantity_outbox o
+                JOIN pos_backend b ON b.id = o.backend_id
+                WHERE o.queued_at <= now() at time zone 'UTC'
+                    - b.stock_export_debounce * interval '1 second'
+                FOR UPDATE OF o SKIP LOCKED
+            )
+            RETURNING backend_id, barcode, quantity
+            """
+        )
+        due = defaultdict(list)
+        for backend_id, barcode, qty in self.env.cr.fetchall():
+            due[backend_id].append((barcode, qty))
+        self.invalidate_cache()
+        return due
+
+    @api.model
+    def _scheduler_flush(self):
+        """Push the waiting quantities, by chunks of variants per job"""
+        variant_model = self.env["pos.product.variant"]
+        for backend_id, quantities in self._pop_due().items():
+            backend = self.env["pos.backend"].browse(backend_id)
+            barcodes = [barcode for barcode, __ in quantities]
+            bindings = variant_model.search(
+                [
+                    ("backend_id", "=", backend.id),
+                    ("variant_barcode", "in", barcodes),
+                ]
+            )
+            binding_ids = {
+                binding.variant_barcode: binding.id for binding in bindings
+            }
+            quantities = [
+                (binding_ids.get(barcode), barcode, qty)
+                for barcode, qty in quantities
+            ]
+            chunk_size = backend.stock_export_chunk_size
+            for start in range(0, len(quantities), chunk_size):
+                variant_model.with_delay(priority=30).export_quantities(
+                    backend, quantities[start : start + chunk_size]
+                )
+            _logger.debug(
+                "%d quantities flushed to backend %s", len(quantities), backend.name
+            )
+        return True
@@ -65,6 +65,9 @@ class PosProductCategory(models.Model):
 
     def import_product_categories(self, backend, since_date=None, **kwargs):
         now_fmt = fields.Datetime.now()
+        # Start from the last update seen on Pos rather than the last run
+        import_state = backend._get_import_state("pos.product.category")
+        since_date = import_state.get_since_date(since_date)
 
         if since_date:
             date = {'start': since_date}
@@ -75,7 +78,9 @@ class PosProductCategory(models.Model):
             backend, filters={'date': date}, priority=5, **kwargs
         )
 
-        backend.import_categories_from_date = now_fmt
+        backend.import_categories_from_date = (
+            import_state.high_water_mark or backend.import_categories_from_date
+        )
         return True
 
     def export_product_category(self, backend, data):
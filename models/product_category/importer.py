@@ -92,6 +92,7 @@ class ProductCategoryImporter(Component):
     _inherit = "pos.importer"
     _apply_on = "pos.product.category"
     _model_name = "pos.product.category"
+    _concurrency_sensitive = True
 
     def _import_dependencies(self):
         """
@@ -110,7 +111,7 @@ class ProductCategoryImporter(Component):
 
 class ProductCategoryBatchImporter(Component):
     _name = "pos.product.category.delayed.batch.importer"
-    _inherit = "pos.delayed.batch.importer"
+    _inherit = "pos.chunked.batch.importer"
     _apply_on = "pos.product.category"
 
     _model_name = "pos.product.category"
\ No newline at end of file
@@ -1,9 +1,16 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
-from odoo import api, fields, models
+import logging
+from collections import defaultdict
+
+from odoo import _, api, fields, models
 
 from odoo.addons.component.core import Component
 
+from ...components.backend_adapter import retryable_error
+
+_logger = logging.getLogger(__name__)
+
 
 class ProductProduct(models.Model):
     _name = "product.product"
@@ -140,7 +147,32 @@ class PosProductCombination(models.Model):
     )
     reference = fields.Char(string="Original reference")
     variant_barcode = fields.Char(string="Pos variant barcode")
+    pos_payload_hash = fields.Char(
+        string="Pos record hash",
+        help="Hash of the last imported Pos record, used to skip the import "
+        "of unchanged records.",
+        readonly=True,
+        copy=False,
+    )
     size = fields.Char(string="Pos variant size")
+    pos_exported_qty = fields.Float(
+        string="Exported Quantity",
+        help="Last quantity pushed to Pos by the stock export.",
+        readonly=True,
+        copy=False,
+    )
+    pos_qty_exported_at = fields.Datetime(
+        string="Quantity Exported At",
+        help="Date of the last push of the quantity to Pos.",
+        readonly=True,
+        copy=False,
+    )
+
+    def _get_pos_qty_products(self):
+        return self.mapped("odoo_id")
+
+    def _get_stock_qty(self, quantities):
+        return quantities.get(self.odoo_id.id, 0.0)
 
     @api.model
     def export_product_quantities(self, backend):
@@ -175,29 +207,99 @@ class PosProductCombination(models.Model):
             exporter = work.component(usage="product.quantity.exporter")
             exporter.run(barcode, new_qty)
 
-    def export_product_stock_qty(self, backend):
-        # NEED HELP
-        # Must have condition for list_variant
-        # still list all variants from ODOO
-        variant_records = self.search([])
-        for variant_record in variant_records:
-            # product has found at many locations
-            # the necessary "lot_stock_id" is found by chain below
-            # pos.backend -> stock.warehouse -> stock.location
-            warehouse_record = self.env["stock.warehouse"].search([("id", "=", backend.warehouse_id.id)])
-            stock_location_id = warehouse_record.lot_stock_id.id
-            stock_record = self.env["stock.quant"].search([
-                ("product_id", "=", variant_record.odoo_id.id),
-                ("location_id","=", stock_location_id)]
+    def export_product_stock_qty(self, backend, force=False):
+        """
+        Push the quantities in stock of all the variants of the backend.
+
+        Only the quantities which changed since their last push are sent,
+        unless `force` is set. They are pushed by chunks of
+        ``stock_export_chunk_size`` variants, one job per chunk.
+
+        :param backend: The Pos backend.
+        :param force: Push all the quantities.
+        :return: The number of quantities to push.
+        :rtype: int
+        """
+        bindings = self.search(
+            [
+                ("backend_id", "=", backend.id),
+                ("variant_barcode", "!=", False),
+            ]
+        )
+        stock_quantities = backend._get_stock_quantities(bindings.mapped("odoo_id"))
+        quantities = []
+        for binding in bindings:
+            new_qty = binding._pos_qty(backend, stock_quantities)
+            if (
+                force
+                or not binding.pos_qty_exported_at
+                or binding.pos_exported_qty != new_qty
+            ):
+                quantities.append((binding.id, binding.variant_barcode, new_qty))
+
+        chunk_size = backend.stock_export_chunk_size
+        for start in range(0, len(quantities), chunk_size):
+            self.with_delay(priority=30).export_quantities(
+                backend, quantities[start : start + chunk_size]
             )
+        _logger.info(
+            "%d of %d variant quantities to export to backend %s",
+            len(quantities),
+            len(bindings),
+            backend.name,
+        )
+        return len(quantities)
+
+    def queue_stock_quantities(self, backend):
+        """
+        Queue the quantities in stock of the bindings in the outbox, to be
+        pushed to Pos after the debounce window of the backend.
+
+        :param backend: The Pos backend.
+        """
+        bindings = self.filtered(
+            lambda binding: binding.backend_id == backend and binding.variant_barcode
+        )
+        stock_quantities = backend._get_stock_quantities(bindings.mapped("odoo_id"))
+        self.env["pos.quantity.outbox"].enqueue(
+            backend,
+            {
+                binding.variant_barcode: binding._pos_qty(backend, stock_quantities)
+                for binding in bindings
+            },
+        )
 
-            new_qty = stock_record["quantity"]
+    def export_quantities(self, backend, quantities):
+        """
+        Push a chunk of quantities to Pos and store them on the bindings.
 
-            backend.env["pos.product.variant"].with_delay().export_quantity(
-                backend=backend,
-                barcode=variant_record.variant_barcode,
-                new_qty=new_qty
+        :param backend: The Pos backend.
+        :param quantities: ``(binding id, barcode, quantity)`` tuples, the
+                           binding id being None for a barcode without
+                           binding.
+        :type quantities: list
+        """
+        with backend.work_on(self._name) as work:
+            exporter = work.component(usage="product.quantity.exporter")
+            exported, failed = exporter.run_many(
+                [(barcode, qty) for __, barcode, qty in quantities]
+            )
+        # Store the pushed quantities with one write per quantity
+        binding_ids = defaultdict(list)
+        for binding_id, barcode, qty in quantities:
+            if binding_id and barcode in exported:
+                binding_ids[qty].append(binding_id)
+        now = fields.Datetime.now()
+        for qty, ids in binding_ids.items():
+            self.browse(ids).with_context(connector_no_export=True).write(
+                {"pos_exported_qty": qty, "pos_qty_exported_at": now}
+            )
+        if failed:
+            return _("%d quantities exported, failed for barcodes: %s") % (
+                len(exported),
+                ", ".join(sorted(failed)),
             )
+        return _("%d quantities exported.") % len(exported)
     
     def export_product_variant(self, backend, data):
         """Export the inventory configuration and quantity of a product."""
@@ -274,6 +376,7 @@ class ProductCombinationAdapter(Component):
     _pos_model = "product_variant"
     _export_node_name = "product_variant"
 
+    @retryable_error
     def update_new_quantity(self, barcode, new_qty):
         result = self.client.edit(
             "product_variant", 
@@ -1,7 +1,9 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
 
+import logging
 
 from odoo.addons.component.core import Component
+from odoo.addons.connector.exception import NetworkRetryableError
 from ...components.backend_adapter import retryable_error
 from ....pospyt.pospyt import (
     PosWebservice,
@@ -9,6 +11,9 @@ from ....pospyt.pospyt import (
     PosWebServiceError
 )
 
+_logger = logging.getLogger(__name__)
+
+
 class ProductQuantityExporter(Component):
     _name = "pos.product.variant.exporter"
     _inherit = "pos.exporter"
@@ -43,6 +48,46 @@ class ProductQuantityExporter(Component):
         except Exception as e:
             print("Response: ", e)
 
+    def run_many(self, quantities):
+        """
+        Push the quantities of several variants with the same client.
+
+        Pos has no endpoint to update the quantities of several variants at
+        once, so they are still sent one by one, but within one job.
+
+        :param quantities: ``(barcode, quantity)`` tuples.
+        :type quantities: list
+        :return: The barcodes whose quantity was pushed and the ones whose
+                 push failed.
+        :rtype: tuple(set, set)
+        :raise: NetworkRetryableError if the network fails before any
+                quantity is pushed.
+        """
+        exported, failed = set(), set()
+        for index, (barcode, new_qty) in enumerate(quantities):
+            try:
+                response = self.backend_adapter.update_new_quantity(
+                    barcode=barcode, new_qty=new_qty
+                )
+            except NetworkRetryableError:
+                if not exported:
+                    raise
+                # keep what has been pushed, the next export sends the rest
+                failed.update(barcode for barcode, __ in quantities[index:])
+                break
+            except PosWebServiceError as err:
+                _logger.warning("Quantity of %s not exported: %s", barcode, err)
+                failed.add(barcode)
+                continue
+            if isinstance(response, dict) and not response.get("success", True):
+                _logger.warning(
+                    "Quantity of %s not exported: %s", barcode, response.get("data")
+                )
+                failed.add(barcode)
+            else:
+                exported.add(barcode)
+        return exported, failed
+
     def export_variant(self, data, **kwargs):
         try:
             backend = kwargs.get("backend")
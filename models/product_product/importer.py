@@ -7,6 +7,8 @@ from odoo import models
 from odoo.addons.component.core import Component
 from odoo.addons.connector.components.mapper import mapping, only_create
 
+from ...utils.code import next_free_code
+
 _logger = logging.getLogger(__name__)
 try:
     from ....pospyt.pospyt import PosWebServiceError
@@ -18,6 +20,7 @@ class ProductCombinationImporter(Component):
     _name = "pos.product.variant.importer"
     _inherit = ["pos.importer","pos.adapter"]
     _apply_on = "pos.product.variant"
+    _payload_hash_field = "pos_payload_hash"
 
     def template_attribute_lines(self, option_values): # Not run
         record = self.pos_record
@@ -54,6 +57,7 @@ class ProductCombinationImporter(Component):
 
     def _after_import(self, binding):
         super()._after_import(binding)
+        self.component(usage="product.matcher").add(binding.odoo_id)
         # self.import_supplierinfo(binding)
 
     def _has_to_skip(self, binding):
@@ -64,7 +68,11 @@ class ProductCombinationImporter(Component):
 
         # Search for a product template by barcode
         barcode = pos_product_variant_record["variant_barcode"]
-        product_variant_mapped = pv_obj.search([("barcode", "=", barcode)])
+        if barcode:
+            matcher = self.component(usage="product.matcher")
+            product_variant_mapped = matcher.products("barcode", barcode)
+        else:
+            product_variant_mapped = pv_obj.search([("barcode", "=", barcode)])
 
         # If variant is exist -> only update quantity
         if product_variant_mapped:
@@ -159,13 +167,15 @@ class ProductCombinationMapper(Component):
             option_values = [option_values]
         
         tmpl_values = template.attribute_line_ids.mapped("product_template_value_ids")
+        option_value_binder = self.binder_for(
+            "pos.product.variant.option.value"
+        )
+        option_value_bindings = option_value_binder.to_internal_many(
+            [option_value["id"] for option_value in option_values]
+        )
         
         for option_value in option_values:
-            option_value_binder = self.binder_for(
-                "pos.product.variant.option.value"
-            )
-            
-            option_value_binding = option_value_binder.to_internal(option_value["id"])
+            option_value_binding = option_value_bindings[option_value["id"]]
             tmpl_value = tmpl_values.filtered(
                 lambda v: v.product_attribute_value_id.id
                 == option_value_binding.odoo_id.id
@@ -187,34 +197,17 @@ class ProductCombinationMapper(Component):
         template_binding = self.get_main_template_binding(record)
         return {"main_template_id": template_binding.id}
 
-    def _product_code_exists(self, code):
-        model = self.env["product.product"]
-        variant_binder = self.binder_for("pos.product.variant")
-        product = model.with_context(active_test=False).search(
-            [
-                ("default_code", "=", code),
-                ("company_id", "=", self.backend_record.company_id.id),
-            ],
-            limit=1,
-        )
-        return product and not variant_binder.to_external(product, wrap=True)
-
     @mapping
     def default_code(self, record):
         code = record.get("reference")
         if not code:
             code = "{}_{}".format(record["product_id"], record["id"])
-        if (
-            not self._product_code_exists(code)
-            or self.backend_record.matching_product_ch == "reference"
-        ):
+        if self.backend_record.matching_product_ch == "reference":
             return {"default_code": code}
-        i = 1
-        current_code = "{}_{}".format(code, i)
-        while self._product_code_exists(current_code):
-            i += 1
-            current_code = "{}_{}".format(code, i)
-        return {"default_code": current_code}
+        taken = self._get_taken_codes(
+            "product.product", "default_code", code, "pos.product.variant"
+        )
+        return {"default_code": next_free_code(code, taken)}
 
     @mapping
     def variant_barcode(self, record):
@@ -228,26 +221,11 @@ class ProductCombinationMapper(Component):
 
 
     def _get_tax_ids(self, record): # Make default id_tax_rules_group
-        product_tmpl_adapter = self.component(
-            usage="backend.adapter", model_name="pos.product.template"
-        )
-        tax_group = {"id_tax_rules_group": 1}
-        tax_group = self.binder_for("pos.account.tax.group").to_internal(
-            tax_group["id_tax_rules_group"], unwrap=True
-        )
-
-        return tax_group.tax_ids
+        tax_ids = self.backend_record._get_pos_tax_group_taxes(1)
+        return self.env["account.tax"].browse(tax_ids or ())
 
     def _apply_taxes(self, tax, price):
-        if self.backend_record.taxes_included == tax.price_include:
-            return price
-        factor_tax = tax.price_include and (1 + tax.amount / 100) or 1.0
-        if self.backend_record.taxes_included:
-            if not tax.price_include:
-                return price / factor_tax
-        else:
-            if tax.price_include:
-                return price * factor_tax
+        return price * self.backend_record._get_tax_price_factor(tax.id)
 
     @mapping
     def specific_price(self, record):
@@ -272,18 +250,15 @@ class ProductCombinationMapper(Component):
         """Will bind the product to an existing one with the same code"""
         if self.backend_record.matching_product_template:
             code = record.get(self.backend_record.matching_product_ch)
+            matcher = self.component(usage="product.matcher")
             if self.backend_record.matching_product_ch == "reference":
                 if code:
-                    product = self.env["product.product"].search(
-                        [("default_code", "=", code)], limit=1
-                    )
+                    product = matcher.products("default_code", code)[:1]
                     if product:
                         return {"odoo_id": product.id}
             if self.backend_record.matching_product_ch == "barcode":
                 if code:
-                    product = self.env["product.product"].search(
-                        [("barcode", "=", code)], limit=1
-                    )
+                    product = matcher.products("barcode", code)[:1]
                     if product:
                         return {"odoo_id": product.id}
 
@@ -315,6 +290,7 @@ class ProductCombinationOptionImporter(Component):
     _name = "pos.product.variant.option.importer"
     _inherit = "pos.importer"
     _apply_on = "pos.product.variant.option"
+    _concurrency_sensitive = True
 
     def _import_values(self, attribute_binding):
         option_value = self.pos_record
@@ -385,6 +361,7 @@ class ProductCombinationOptionValueImporter(Component):
     _name = "pos.product.variant.option.value.importer"
     _inherit = "pos.importer"
     _apply_on = "pos.product.variant.option.value"
+    _concurrency_sensitive = True
 
     _translatable_fields = {
         "pos.product.variant.option.value": ["name"],
@@ -68,16 +68,39 @@ class ProductQtyMixin(models.AbstractModel):
         return True
 
     def _recompute_pos_qty_backend(self, backend):
-        locations = backend._get_locations_for_stock_quantities()
-        self_loc = self.with_context(location=locations.ids, compute_child=False)
-        for product_binding in self_loc:
-            new_qty = product_binding._pos_qty(backend)
+        quantities = backend._get_stock_quantities(self._get_pos_qty_products())
+        changed_ids = defaultdict(list)
+        for product_binding in self:
+            new_qty = product_binding._pos_qty(backend, quantities)
             if product_binding.quantity != new_qty:
-                product_binding.quantity = new_qty
+                changed_ids[new_qty].append(product_binding.id)
+        if not changed_ids:
+            return True
+        # one write per quantity, the export is notified once for all of them
+        for new_qty, ids in changed_ids.items():
+            self.browse(ids).with_context(connector_no_export=True).write(
+                {"quantity": new_qty}
+            )
+        changed = self.browse([id_ for ids in changed_ids.values() for id_ in ids])
+        self._event("on_pos_quantities_change").notify(changed, backend=backend)
         return True
 
-    def _pos_qty(self, backend):
-        qty = self[backend.product_qty_field]
+    def _get_pos_qty_products(self):
+        """Return the products whose quantities are pushed for the bindings"""
+        raise NotImplementedError
+
+    def _get_stock_qty(self, quantities):
+        """
+        Return the quantity in stock of the binding.
+
+        :param quantities: The quantities of the products returned by
+                           :meth:`_get_pos_qty_products`, by product id.
+        :type quantities: dict
+        """
+        raise NotImplementedError
+
+    def _pos_qty(self, backend, quantities):
+        qty = self._get_stock_qty(quantities)
         if qty < 0:
             # make sure we never send negative qty to POS
             # because the overall qty computed at template level
@@ -126,6 +149,13 @@ class PosProductTemplate(models.Model):
     )
     show_price = fields.Boolean(string="Display Price", default=True)
     pos_barcode = fields.Char(string="Pos barcode")
+    pos_payload_hash = fields.Char(
+        string="Pos record hash",
+        help="Hash of the last imported Pos record, used to skip the import "
+        "of unchanged records.",
+        readonly=True,
+        copy=False,
+    )
     variants_ids = fields.One2many(
         comodel_name="pos.product.variant",
         inverse_name="main_template_id",
@@ -154,8 +184,19 @@ class PosProductTemplate(models.Model):
         default="both",
     )
 
+    def _get_pos_qty_products(self):
+        return self.mapped("product_variant_ids")
+
+    def _get_stock_qty(self, quantities):
+        return sum(
+            quantities.get(product.id, 0.0) for product in self.product_variant_ids
+        )
+
     def import_products(self, backend, since_date=None, **kwargs):
         now_fmt = datetime.datetime.now()
+        # Start from the last update seen on Pos, or from an earlier date asked
+        import_state = backend._get_import_state("pos.product.template")
+        since_date = import_state.get_since_date(since_date)
 
         if since_date:
             date = {'start': since_date}
@@ -166,7 +207,9 @@ class PosProductTemplate(models.Model):
             backend, filters={'date': date}, priority=15, **kwargs
         )
 
-        backend.import_products_since = now_fmt
+        backend.import_products_since = (
+            import_state.high_water_mark or backend.import_products_since
+        )
 
         return True
 
@@ -176,8 +219,8 @@ class PosProductTemplate(models.Model):
             return importer.run(priority=60)
 
     def export_inventory(self, fields=None):
-        """Export the inventory configuration and quantity of a product."""
-        backend = self.backend_id
+        """Export the inventory configuration and quantity of products."""
+        backend = self.mapped("backend_id")
         with backend.work_on("pos.product.template") as work:
             exporter = work.component(usage="inventory.exporter")
             return exporter.run(self, fields)
@@ -234,8 +277,33 @@ class PosProductQuantityListener(Component):
     @skip_if(lambda self, record, **kwargs: self.no_connector_export(record))
     def on_record_write(self, record, fields=None):
         inventory_fields = list(set(fields).intersection(self._get_inventory_fields()))
+        if record._name == "pos.product.variant" and "quantity" in inventory_fields:
+            # coalesced with the other changes of the barcode
+            if record.variant_barcode:
+                self.env["pos.quantity.outbox"].enqueue(
+                    record.backend_id, {record.variant_barcode: record.quantity}
+                )
+            inventory_fields.remove("quantity")
         if inventory_fields:
             record.with_delay(
                 priority=20,
                 identity_key=identity_exact,
             ).export_inventory(fields=inventory_fields)
+
+    @skip_if(lambda self, records, **kwargs: self.no_connector_export(records))
+    def on_pos_quantities_change(self, records, backend=None):
+        """Export the quantities of bindings recomputed together"""
+        if records._name == "pos.product.variant":
+            self.env["pos.quantity.outbox"].enqueue(
+                backend,
+                {
+                    record.variant_barcode: record.quantity
+                    for record in records
+                    if record.variant_barcode
+                },
+            )
+        else:
+            records.with_delay(
+                priority=20,
+                identity_key=identity_exact,
+            ).export_inventory(fields=["quantity"])
@@ -14,6 +14,7 @@ from odoo.addons.connector.components.mapper import (
 )
 from odoo.addons.queue_job.exception import FailedJobError
 from odoo.addons.queue_job.job import identity_exact
+from ...utils.code import next_free_code
 from ...utils.datetime import (
     format_date_string,
     parse_date_string
@@ -31,11 +32,6 @@ try:
 except ImportError:
     _logger.debug("Cannot import `bs4`")
 
-try:
-    from ....pospyt.pospyt import PosWebServiceError
-except ImportError:
-    _logger.debug("Cannot import from `pospyt`")
-
 
 class TemplateMapper(Component):
     _name = "pos.product.template.mapper"
@@ -70,15 +66,7 @@ class TemplateMapper(Component):
             return {"weight": record.get("weight", 0.0)}
 
     def _apply_taxes(self, tax, price):
-        if self.backend_record.taxes_included == tax.price_include:
-            return price
-        factor_tax = tax.price_include and (1 + tax.amount / 100) or 1.0
-        if self.backend_record.taxes_included:
-            if not tax.price_include:
-                return price / factor_tax
-        else:
-            if tax.price_include:
-                return price * factor_tax
+        return price * self.backend_record._get_tax_price_factor(tax.id)
 
     @mapping
     def list_price(self, record):
@@ -123,20 +111,21 @@ class TemplateMapper(Component):
         # is a potential template to be matched
         template = self.env["product.template"]
         variants = record.get("variants", [])
-        
+        backend_adapter = self.component(
+            usage="backend.adapter",
+            model_name="pos.product.variant",
+        )
+        pos_variants = backend_adapter.read_many([prod["id"] for prod in variants])
+        matcher = self.component(usage="product.matcher")
+        matcher.prefetch(list(pos_variants.values()))
+
         for prod in variants:
-            backend_adapter = self.component(
-                usage="backend.adapter",
-                model_name="pos.product.variant",
-            )
-            variant = backend_adapter.read(int(prod["id"]))
+            variant = pos_variants[int(prod["id"])]
             code = variant.get(self.backend_record.matching_product_ch)
             if not code:
                 continue
             if self.backend_record.matching_product_ch == "reference":
-                product = self.env["product.product"].search(
-                    [("default_code", "=", code)]
-                )
+                product = matcher.products("default_code", code)
                 if len(product) > 1:
                     raise ValidationError(
                         _(
@@ -149,7 +138,7 @@ class TemplateMapper(Component):
                 template |= product.product_tmpl_id
 
             if self.backend_record.matching_product_ch == "barcode":
-                product = self.env["product.product"].search([("barcode", "=", code)])
+                product = matcher.products("barcode", code)
                 if len(product) > 1:
                     raise ValidationError(
                         _(
@@ -175,20 +164,17 @@ class TemplateMapper(Component):
 
     def _match_template_odoo_record(self, record):
         code = record.get(self.backend_record.matching_product_ch)
+        matcher = self.component(usage="product.matcher")
         if self.backend_record.matching_product_ch == "reference":
             if code:
                 if self._template_code_exists(code):
-                    product = self.env["product.template"].search(
-                        [("default_code", "=", code)], limit=1
-                    )
+                    product = matcher.templates("default_code", code)[:1]
                     if product:
                         return {"odoo_id": product.id}
 
         if self.backend_record.matching_product_ch == "barcode":
             if code:
-                product = self.env["product.template"].search(
-                    [("barcode", "=", code)], limit=1
-                )
+                product = matcher.templates("barcode", code)[:1]
                 if product:
                     return {"odoo_id": product.id}
 
@@ -225,20 +211,13 @@ class TemplateMapper(Component):
         if not code:
             code = "backend_%d_product_%s" % (self.backend_record.id, record["id"])
 
-        if (
-            not self._template_code_exists(code)
-            or self.backend_record.matching_product_ch == "reference"
-        ):
+        if self.backend_record.matching_product_ch == "reference":
             return {"default_code": code}
-        
-        i = 1
-        current_code = "%s_%d" % (code, i)
-
-        while self._template_code_exists(current_code):
-            i += 1
-            current_code = "%s_%d" % (code, i)
 
-        return {"default_code": current_code}
+        taken = self._get_taken_codes(
+            "product.template", "default_code", code, "pos.product.template"
+        )
+        return {"default_code": next_free_code(code, taken)}
 
     def clear_html_field(self, content):
         html = html2text.HTML2Text()
@@ -274,11 +253,8 @@ class TemplateMapper(Component):
         product_categories = self.env["product.category"].browse()
         binder = self.binder_for("pos.product.category")
 
-        for pos_category in categories:
-            product_categories |= binder.to_internal(
-                pos_category,
-                unwrap=True,
-            )
+        for category in binder.to_internal_many(categories, unwrap=True).values():
+            product_categories |= category
 
         return {"categ_ids": [(6, 0, product_categories.ids)]}
 
@@ -313,16 +289,17 @@ class TemplateMapper(Component):
         return {"pos_barcode": barcode}
 
     def _get_tax_ids(self, record):
-        binder = self.binder_for("pos.account.tax.group")
-        tax_group = binder.to_internal(
-            1, # Make default id_tax_rules_group
-            unwrap=True,
-        )
-        tax_ids = tax_group.tax_ids
-        if tax_group:
+        # Make default id_tax_rules_group
+        tax_ids = self.backend_record._get_pos_tax_group_taxes(1)
+        if tax_ids is None:
+            return self.env["account.tax"].browse()
+        if len(tax_ids) != 1:
+            tax_group = self.binder_for("pos.account.tax.group").to_internal(
+                1, unwrap=True
+            )
             ERROR = "Tax group `{}` should have one and only one tax, currently have {}"
-            assert len(tax_ids) == 1, _(ERROR).format(tax_group.name, len(tax_ids))
-        return tax_ids
+            raise AssertionError(_(ERROR).format(tax_group.name, len(tax_ids)))
+        return self.env["account.tax"].browse(tax_ids)
 
     @mapping
     def taxes_id(self, record):
@@ -390,19 +367,19 @@ class ProductInventoryBatchImporter(Component):
 
         return _super.run(filters, **kwargs)
 
-    def _run_page(self, filters, **kwargs):
-        records = self.client.list("product_variant", filters)
-        for variant in records:
-            self._import_record(variant["id"], record=variant, **kwargs)
+    def _store_payloads(self, records):
+        # The inventory importer needs the whole variant record
+        return records
 
-        return [x["id"] for x in records]
-    
-    def _import_record(self, record_id, record=None, **kwargs):
+    def _import_record(self, record, **kwargs):
         """Delay the import of the records"""
-        assert record
-        priority = kwargs.pop("priority", None)
-        self.env["pos._import_stock_available"].with_delay(priority=priority).import_record(
-            self.backend_record, record_id, record=record, **kwargs
+        self._delay(
+            self.env["pos._import_stock_available"],
+            "import_record",
+            self.backend_record,
+            record["id"],
+            record=record,
+            **kwargs
         )
 
 
@@ -476,6 +453,7 @@ class ProductTemplateImporter(Component):
     _name = "pos.product.template.importer"
     _inherit = "pos.importer"
     _apply_on = "pos.product.template"
+    _payload_hash_field = "pos_payload_hash"
 
     _base_mapper = TemplateMapper
 
@@ -501,6 +479,9 @@ class ProductTemplateImporter(Component):
 
     def _after_import(self, binding):
         super()._after_import(binding)
+        self.component(usage="product.matcher").add(
+            binding.odoo_id.product_variant_ids
+        )
         # self.import_images(binding)
         self.attribute_line(binding)
         self.import_variants()
@@ -537,8 +518,11 @@ class ProductTemplateImporter(Component):
         if not isinstance(option_values, list):
             option_values = [option_values]
 
+        option_value_bindings = option_value_binder.to_internal_many(
+            [option_value["id"] for option_value in option_values]
+        )
         for option_value in option_values:
-            value = option_value_binder.to_internal(option_value["id"]).odoo_id
+            value = option_value_bindings[option_value["id"]].odoo_id
             attr_id = value.attribute_id.id
             value_id = value.id
             if attr_id not in attribute_values:
@@ -617,9 +601,6 @@ class ProductTemplateImporter(Component):
                 )
 
     def _import_dependencies(self):
-        self._import_default_category()
-        self._import_categories()
-
         record = self.pos_record
         option_values = (
             record.get("variants", [])
@@ -628,20 +609,25 @@ class ProductTemplateImporter(Component):
         if not isinstance(option_values, list):
             option_values = [option_values]
 
-        backend_adapter = self.component(
-            usage="backend.adapter",
-            model_name="pos.product.variant.option.value",
-        )
-
-        for option_value in option_values:
-            # option_value = backend_adapter.read(option_value["id"])
-            self._import_dependency(
-                option_value,
-                "pos.product.variant.option",
-            )
-            self._import_dependency(
-                option_value, "pos.product.variant.option.value"
-            )
+        # Collect all the dependencies first, so the ones already bound
+        # are resolved with one query per model
+        dependencies = []
+        if int(record["category_id"]):
+            dependencies.append((record["category_id"], "pos.product.category"))
+        dependencies += [
+            (option_value, "pos.product.variant.option")
+            for option_value in option_values
+        ]
+        dependencies += [
+            (option_value, "pos.product.variant.option.value")
+            for option_value in option_values
+        ]
+
+        failed = self._import_dependencies_many(dependencies)
+        if any(model == "pos.product.category" for __, model in failed):
+            # an activity will be added in _after_import (because
+            # we'll know the binding at this point)
+            self.default_category_error = True
 
     def get_template_model_id(self):
         ir_model = self.env["ir.model"].search(
@@ -650,37 +636,51 @@ class ProductTemplateImporter(Component):
         assert len(ir_model) == 1
         return ir_model.id
 
-    def _import_default_category(self):
-        record = self.pos_record
-        if int(record["category_id"]):
-            try:
-                self._import_dependency(
-                    record["category_id"], "pos.product.category"
-                )
-            except PosWebServiceError:
-                # an activity will be added in _after_import (because
-                # we'll know the binding at this point)
-                self.default_category_error = True
-
-    def _import_categories(self):
-        record = self.pos_record
-        category_id = record.get("category_id")    
-
-        self._import_dependency(category_id, "pos.product.category")
-
     def _has_to_skip(self, binding):
         pos_product_template_record = self.pos_record
         ppt_obj = self.env["pos.product.template"]
+        matcher = self.component(usage="product.matcher")
+        # Search the products of the template and of its variants at once
+        matcher.prefetch([pos_product_template_record])
 
         # Search for a product template by barcode
         barcode = pos_product_template_record["barcode"]
-        product_template_mapped = ppt_obj.search([("pos_barcode", "=", barcode)])
+        if barcode:
+            product_template_mapped = matcher.template_bindings(barcode)
+        else:
+            product_template_mapped = ppt_obj.search([("pos_barcode", "=", barcode)])
 
         if product_template_mapped:
             return True
 
+        if not binding:
+            self._check_matching_duplicates()
         return False
 
+    def _check_matching_duplicates(self):
+        """
+        Raise before importing anything if a variant of the record matches
+        several products.
+        """
+        backend = self.backend_record
+        variants = self.pos_record.get("variants") or []
+        if not isinstance(variants, list):
+            variants = [variants]
+        if (
+            not backend.matching_product_template
+            or not backend.matching_product_ch
+            or not variants
+        ):
+            return
+        backend_adapter = self.component(
+            usage="backend.adapter",
+            model_name="pos.product.variant",
+        )
+        pos_variants = backend_adapter.read_many([prod["id"] for prod in variants])
+        field = "default_code" if backend.matching_product_ch == "reference" else "barcode"
+        matcher = self.component(usage="product.matcher")
+        matcher.check_duplicates(list(pos_variants.values()), field)
+
 
 class ProductTemplateBatchImporter(Component):
     _name = "pos.product.template.batch.importer"
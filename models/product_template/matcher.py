@@ -0,0 +1,153 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
+
+import logging
+
+from odoo import _
+from odoo.exceptions import ValidationError
+
+from odoo.addons.component.core import Component
+
+_logger = logging.getLogger(__name__)
+
+
+class ProductMatcher(Component):
+    """Match the Pos products with the Odoo products by barcode or reference.
+
+    The products of all the barcodes and references of a page of Pos
+    records are searched with one query per field, and kept in the
+    ``product_match_index`` given to ``pos.backend.work_on``, shared with
+    the importers of the variants of the job. A code which has not been
+    prefetched is searched on its first lookup.
+    """
+
+    _name = "pos.product.matcher"
+    _inherit = "base.pos.connector"
+    _apply_on = ["pos.product.template", "pos.product.variant"]
+    _usage = "product.matcher"
+
+    # Pos record keys holding the codes, per field of `product.product`
+    _code_keys = {
+        "barcode": ("barcode", "variant_barcode"),
+        "default_code": ("reference",),
+    }
+
+    def _get_index(self):
+        index = getattr(self.work, "product_match_index", None)
+        if index is None:
+            # work context not opened by the backend, the index is only
+            # kept in this work context
+            index = self.work.product_match_index = {}
+        return index
+
+    def _collect_codes(self, records):
+        codes = {field: set() for field in self._code_keys}
+        for record in records:
+            variants = record.get("variants") or []
+            if not isinstance(variants, list):
+                variants = [variants]
+            for pos_record in [record] + variants:
+                for field, keys in self._code_keys.items():
+                    codes[field].update(
+                        pos_record[key] for key in keys if pos_record.get(key)
+                    )
+        return codes
+
+    def _load(self, model_name, field, codes):
+        """Search the records of the codes missing from the index"""
+        entries = self._get_index().setdefault((model_name, field), {})
+        missing = [code for code in codes if code and code not in entries]
+        if missing:
+            for code in missing:
+                entries[code] = []
+            for record in self.env[model_name].search([(field, "in", missing)]):
+                entries[record[field]].append(record.id)
+            _logger.debug(
+                "%d %s codes of %s prefetched", len(missing), field, model_name
+            )
+        return entries
+
+    def prefetch(self, records):
+        """
+        Search the products matching the codes of the Pos records.
+
+        :param records: The Pos records of templates (with their variants)
+                        or variants.
+        :type records: list
+        """
+        codes = self._collect_codes(records)
+        for field, field_codes in codes.items():
+            self._load("product.product", field, field_codes)
+        self._load("pos.product.template", "pos_barcode", codes["barcode"])
+
+    def products(self, field, code):
+        """
+        Return the products having `code` as barcode or reference.
+
+        :param field: ``barcode`` or ``default_code``
+        :param code: The barcode or reference.
+        :return: The products, in the default order of the products.
+        :rtype: recordset
+        """
+        if not code:
+            return self.env["product.product"].browse()
+        ids = self._load("product.product", field, [code])[code]
+        return self.env["product.product"].browse(ids)
+
+    def templates(self, field, code):
+        """
+        Return the templates of the products having `code` as barcode or
+        reference, the first one being the one matched with ``limit=1``.
+
+        :rtype: recordset
+        """
+        templates = self.products(field, code).mapped("product_tmpl_id")
+        if field == "default_code":
+            # The reference of a template is the one of its single variant
+            templates = templates.filtered(lambda t: t.default_code == code)
+        if len(templates) > 1:
+            templates = self.env["product.template"].search([("id", "in", templates.ids)])
+        return templates
+
+    def template_bindings(self, barcode):
+        """Return the template bindings having `barcode` as Pos barcode"""
+        if not barcode:
+            return self.env["pos.product.template"].browse()
+        ids = self._load("pos.product.template", "pos_barcode", [barcode])[barcode]
+        return self.env["pos.product.template"].browse(ids)
+
+    def add(self, products):
+        """
+        Record the codes of products created or updated by the job in the
+        index, for the lookups of the next records.
+
+        :param products: The products (``product.product``).
+        :type products: recordset
+        """
+        index = self._get_index()
+        for product in products:
+            for field in self._code_keys:
+                entries = index.get(("product.product", field), {})
+                code = product[field]
+                if code and code in entries and product.id not in entries[code]:
+                    entries[code].append(product.id)
+
+    def check_duplicates(self, records, field):
+        """
+        Raise if a code of the Pos records matches several products.
+
+        The duplicates are detected before the import of the record and of
+        its dependencies, instead of when the record is mapped.
+
+        :raises ValidationError: If several products have the same code.
+        """
+        self.prefetch(records)
+        for code in sorted(self._collect_codes(records)[field]):
+            if len(self.products(field, code)) > 1:
+                raise ValidationError(
+                    _(
+                        "Error! Multiple products found with "
+                        "variants reference %s. Maybe consider to "
+                        "update you datas"
+                    )
+                    % code
+                )
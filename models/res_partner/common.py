@@ -49,6 +49,9 @@ class PosResPartner(models.Model):
     def import_customers_since(self, backend_record=None, since_date=None, **kwargs):
         """Prepare the import of partners modified on Pos"""   
         now_fmt =  fields.Datetime.now()
+        # Start from the last update seen on Pos rather than the last run
+        import_state = backend_record._get_import_state("pos.res.partner")
+        since_date = import_state.get_since_date(since_date)
 
         if since_date:
             date = {'start': since_date}
@@ -60,7 +63,9 @@ class PosResPartner(models.Model):
             backend=backend_record, filters={'date': date}, priority=5, **kwargs
         )
 
-        backend_record.import_partners_since = now_fmt
+        backend_record.import_partners_since = (
+            import_state.high_water_mark or backend_record.import_partners_since
+        )
         return True
 
 
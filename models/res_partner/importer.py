@@ -118,7 +118,7 @@ class ResPartnerImporter(Component):
 
 class PartnerBatchImporter(Component):
     _name = "pos.res.partner.batch.importer"
-    _inherit = "pos.delayed.batch.importer"
+    _inherit = "pos.chunked.batch.importer"
     _apply_on = "pos.res.partner"
 
     _model_name = "pos.res.partner"
@@ -1,7 +1,6 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
 import logging
-from datetime import timedelta
 
 from ....pospyt.pospyt import PosWebServiceDict
 
@@ -79,6 +78,10 @@ class PosSaleOrder(models.Model):
     def import_orders_since(self, backend, since_date=None, **kwargs):
         """Prepare the import of orders modified on Pos"""
         now_fmt = fields.Datetime.now()
+        # Start from the last update seen on Pos, or from an earlier date asked,
+        # the overlap of the import state replaces the former 10 seconds
+        import_state = backend._get_import_state("pos.sale.order")
+        since_date = import_state.get_since_date(since_date)
 
         if since_date:
             date = {"start": since_date}
@@ -89,8 +92,9 @@ class PosSaleOrder(models.Model):
             backend, filters={'date': date}, priority=80, max_retries=0
         )
 
-        next_check_datetime = now_fmt - timedelta(seconds=10)
-        backend.import_orders_since = next_check_datetime
+        backend.import_orders_since = (
+            import_state.high_water_mark or backend.import_orders_since
+        )
 
         return True
 
@@ -15,6 +15,7 @@ from odoo.addons.connector_ecommerce.components.sale_order_onchange import (
 from odoo.addons.queue_job.exception import FailedJobError, NothingToDoJob
 
 from ...components.exception import OrderImportRuleRetry
+from ...utils.code import next_free_code
 from ...utils.datetime import DATE_FORMAT
 from ...utils.datetime import (
     format_date_string,
@@ -138,11 +139,15 @@ class SaleOrderImportMapper(Component):
         else:
             child_records = source[from_attr]
 
+        # Resolve the products of all the lines at once
+        options = dict(
+            self.options, products_by_barcode=self._prefetch_products(child_records)
+        )
         children = []
         for child_record in child_records:
             mapper = self._get_map_child_component(model_name)
             items = mapper.get_items(
-                [child_record], map_record, to_attr, options=self.options
+                [child_record], map_record, to_attr, options=options
             )
             children.extend(items)
 
@@ -150,6 +155,28 @@ class SaleOrderImportMapper(Component):
             children = self.rebuild_children(children=children, order_rows=child_records)
         return children
 
+    def _prefetch_products(self, order_rows):
+        """
+        Search the products of the order rows with a single query.
+
+        :param order_rows: The order rows of the Pos order.
+        :type order_rows: list
+        :return: The ID of the product of each variant barcode.
+        :rtype: dict
+        """
+        barcodes = {
+            order_row["product"]["variant"]["variant_barcode"]
+            for order_row in order_rows
+            if order_row.get("product", {}).get("variant", {}).get("variant_barcode")
+        }
+        if not barcodes:
+            return {}
+        products = self.env["product.product"].search([("barcode", "in", list(barcodes))])
+        products_by_barcode = {}
+        for product in products:
+            products_by_barcode.setdefault(product.barcode, product.id)
+        return products_by_barcode
+
     def validate_children(self, children):
         for _, _, sale_order_line in children:
             if "product_id" not in sale_order_line:
@@ -177,17 +204,6 @@ class SaleOrderImportMapper(Component):
 
         return product_variant_mapped
 
-    def _sale_order_exists(self, name):
-        sale_order = self.env["sale.order"].search(
-            [
-                ("name", "=", name),
-                ("company_id", "=", self.backend_record.company_id.id),
-            ],
-            limit=1,
-        )
-        return len(sale_order) == 1
-    
-
     @mapping
     def total_paid(self, record):
         return {"total_amount":record["total"]} # giá bao gồm thuế
@@ -203,14 +219,10 @@ class SaleOrderImportMapper(Component):
     @mapping
     def name(self, record):
         basename = record["order_transaction"]
-        if not self._sale_order_exists(basename):
+        if not basename:
             return {"name": basename}
-        i = 1
-        name = basename + "_%d" % (i)
-        while self._sale_order_exists(name):
-            i += 1
-            name = basename + "_%d" % (i)
-        return {"name": name}
+        taken = self._get_taken_codes("sale.order", "name", basename)
+        return {"name": next_free_code(basename, taken)}
 
     @mapping
     def partner_id(self, record):
@@ -315,7 +327,7 @@ class SaleOrderImporter(Component):
         pos_product_and_variant_tuples = []
         order_rows = record.get("order_rows")
         if not order_rows:
-            pos_sale_order_record = self.client.find("order", record["id"])
+            pos_sale_order_record = self.backend_adapter.read(record["id"])
             order_rows = pos_sale_order_record.get("order_rows")
     
         for order_row in order_rows:
@@ -463,6 +475,11 @@ class SaleOrderLineMapper(Component):
         pos_product_record = record["product"]
         pos_variant_record = pos_product_record["variant"]
         variant_barcode = pos_variant_record["variant_barcode"]
+        products_by_barcode = self.options.products_by_barcode
+        if products_by_barcode is not None:
+            product_id = products_by_barcode.get(variant_barcode)
+            return {"product_id": product_id} if product_id else {}
+
         product = self.env["product.product"].search(
             [
                 ("barcode", "=", variant_barcode)
@@ -475,20 +492,8 @@ class SaleOrderLineMapper(Component):
 
         return {"product_id": product.id}
 
-    def _find_tax(self, pos_tax_id):
-        binder = self.binder_for("pos.account.tax")
-        return binder.to_internal(pos_tax_id, unwrap=True)
-
     @mapping
     def tax_id(self, record):
-        # Assign tax to order id
-        taxes = record["id"]
-
-        if not isinstance(taxes, list):
-            taxes = [taxes]
-        result = self.env["account.tax"].browse()
-        for pos_tax in taxes:
-            result |= self._find_tax(pos_tax)
         # id 4 is Value Added Tax (VAT) 10%
         return {"tax_id": [(6, 0, [4])]}
 
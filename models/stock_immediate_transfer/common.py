@@ -7,24 +7,34 @@ class StockImmediateTransfer(models.TransientModel):
 
     def process(self):
         stock_picking_ids = self.pick_ids
+        products = self.env["product.product"].browse()
         for stock_picking in stock_picking_ids:
             sale_order = stock_picking.sale_id
+            if not sale_order:
+                continue
             if sale_order.invoice_status == "invoiced":
                 sale_order.with_delay().write({'order_state': 'delivering'})
             else:
                 sale_order.with_delay().write({'order_state': 'exported'})
 
-            order_lines = sale_order.order_line
-            for line in order_lines:
-                product_id = line.product_id
-                variant_barcode = product_id.barcode
-                new_qty = product_id.qty_available - line.product_uom_qty
-                self.with_delay(priority=300).export_pos_quantity(barcode=variant_barcode, new_qty=new_qty)
-        
+            products |= sale_order.order_line.mapped("product_id")
+
         result = super().process()
+        self._queue_pos_quantities(products)
         return result
 
     def export_pos_quantity(self, barcode, new_qty):
-        backend_records = self.env["pos.backend"].search([])
-        for backend in backend_records:
-            backend.backend_export_quantity(barcode=barcode, new_qty=new_qty)
\ No newline at end of file
+        # kept for the jobs enqueued before the outbox: the quantity is
+        # read again from the quants instead of using `new_qty`
+        bindings = self.env["pos.product.variant"].search(
+            [("variant_barcode", "=", barcode)]
+        )
+        for backend in bindings.mapped("backend_id"):
+            bindings.queue_stock_quantities(backend)
+
+    def _queue_pos_quantities(self, products):
+        # the quantities are pushed once the pickings are done, coalesced
+        # with the other changes of the same products
+        bindings = products.mapped("pos_variants_bind_ids")
+        for backend in bindings.mapped("backend_id"):
+            bindings.queue_stock_quantities(backend)
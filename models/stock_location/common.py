@@ -0,0 +1,38 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
+
+from odoo import api, fields, models
+
+
+class StockLocation(models.Model):
+    _inherit = "stock.location"
+
+    pos_synchronized = fields.Boolean(
+        string="Sync with Pos",
+        help="Check this box to take the quantities of this location into "
+        "account in the quantities pushed to Pos. When no location of the "
+        "backend tree is checked, all its internal locations are used.",
+    )
+
+    def _get_pos_location_fields(self):
+        """Fields which change the locations used by the backends"""
+        return ("pos_synchronized", "usage", "location_id", "active")
+
+    def _invalidate_pos_locations(self):
+        backend_model = self.env["pos.backend"]
+        # Clear the locations cached by the backends
+        backend_model.clear_caches()
+        backend_model._invalidate_stock_quantities()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self._invalidate_pos_locations()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        if set(vals).intersection(self._get_pos_location_fields()):
+            self._invalidate_pos_locations()
+        return super().write(vals)
+
+    def unlink(self):
+        self._invalidate_pos_locations()
+        return super().unlink()
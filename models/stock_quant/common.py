@@ -0,0 +1,21 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl.html)
+
+from odoo import api, models
+
+
+class StockQuant(models.Model):
+    _inherit = "stock.quant"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        # Forget the quantities computed by the backends
+        self.env["pos.backend"]._invalidate_stock_quantities()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self.env["pos.backend"]._invalidate_stock_quantities()
+        return super().write(vals)
+
+    def unlink(self):
+        self.env["pos.backend"]._invalidate_stock_quantities()
+        return super().unlink()
@@ -0,0 +1,15 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from . import test_client_pool
+from . import test_record_cache
+from . import test_import_state
+from . import test_code
+from . import test_binder
+from . import test_lock_manager
+from . import test_importer
+from . import test_product_matcher
+from . import test_tax_cache
+from . import test_stock_export
+from . import test_quantity_outbox
+from . import test_recompute_qty
+from . import test_stock_locations
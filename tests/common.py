@@ -0,0 +1,64 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from odoo.tests.common import SavepointCase
+
+
+class PosTestCase(SavepointCase):
+    """Base class of the tests, with a Pos backend which is never reached"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tracking_disable=True))
+        cls.warehouse = cls.env.ref("stock.warehouse0")
+        cls.stock_location = cls.warehouse.lot_stock_id
+        cls.backend = cls.env["pos.backend"].create(
+            {
+                "name": "Pos Test",
+                "location": "http://localhost:8080",
+                "webservice_key": "TEST_KEY",
+                "warehouse_id": cls.warehouse.id,
+            }
+        )
+
+    @classmethod
+    def _create_template_binding(cls, name, backend=None):
+        template = cls.env["product.template"].create(
+            {"name": name, "type": "product"}
+        )
+        return (
+            cls.env["pos.product.template"]
+            .with_context(connector_no_export=True)
+            .create(
+                {
+                    "odoo_id": template.id,
+                    "backend_id": (backend or cls.backend).id,
+                }
+            )
+        )
+
+    @classmethod
+    def _create_variant_binding(
+        cls, barcode, template_binding=None, product=None, backend=None
+    ):
+        if template_binding is None:
+            template_binding = cls._create_template_binding(barcode, backend)
+        if product is None:
+            product = template_binding.odoo_id.product_variant_id
+        return (
+            cls.env["pos.product.variant"]
+            .with_context(connector_no_export=True)
+            .create(
+                {
+                    "odoo_id": product.id,
+                    "main_template_id": template_binding.id,
+                    "backend_id": (backend or cls.backend).id,
+                    "variant_barcode": barcode,
+                }
+            )
+        )
+
+    def _set_stock(self, product, qty, location=None):
+        self.env["stock.quant"]._update_available_quantity(
+            product, location or self.stock_location, qty
+        )
@@ -0,0 +1,36 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from ..components.binder import PosBinderIndex
+from .common import PosTestCase
+
+
+class TestBinderIndex(PosTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.binding = cls._create_template_binding("Shirt")
+        cls.binding.pos_id = 10
+
+    def _to_internal(self, binder_index, unwrap=False):
+        with self.backend.work_on(
+            "pos.product.template", binder_index=binder_index
+        ) as work:
+            binder = work.component(usage="binder")
+            if binder_index is not None:
+                # load the index
+                binder.to_internal(10)
+            return binder.to_internal(10, unwrap=unwrap)
+
+    def test_index_same_as_database(self):
+        for unwrap in (False, True):
+            from_database = self._to_internal(None, unwrap=unwrap)
+            from_index = self._to_internal(PosBinderIndex(), unwrap=unwrap)
+            self.assertEqual(from_index, from_database)
+            self.assertEqual(from_index.env.context, from_database.env.context)
+            self.assertFalse(from_index.env.context.get("active_test", True))
+
+    def test_index_hit(self):
+        index = PosBinderIndex()
+        self._to_internal(index)
+        self.assertEqual(index.hits, 1)
+        self.assertEqual(index.misses, 0)
@@ -0,0 +1,57 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from unittest import mock
+
+from ..components.backend_adapter import PosClientPool
+from .common import PosTestCase
+
+
+class TestClientPool(PosTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pool = PosClientPool()
+        patcher = mock.patch.object(
+            PosClientPool,
+            "_build_client",
+            side_effect=lambda backend: (mock.Mock(), mock.Mock()),
+        )
+        self.build_client = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_client_shared_by_backend(self):
+        __, client = self.pool.get(self.backend)
+        __, same_client = self.pool.get(self.backend)
+        self.assertIs(client, same_client)
+        self.assertEqual(self.build_client.call_count, 1)
+
+    def test_new_client_when_settings_change(self):
+        __, client = self.pool.get(self.backend)
+        self.backend.webservice_key = "OTHER_KEY"
+        __, new_client = self.pool.get(self.backend)
+        self.assertIsNot(client, new_client)
+
+    def test_invalidate(self):
+        __, client = self.pool.get(self.backend)
+        self.pool.invalidate([self.backend.id])
+        __, new_client = self.pool.get(self.backend)
+        self.assertIsNot(client, new_client)
+
+    def test_idle_client_closed(self):
+        self.backend.connection_idle_timeout = 10
+        with mock.patch("time.monotonic", return_value=1000.0):
+            __, client = self.pool.get(self.backend)
+        with mock.patch("time.monotonic", return_value=1011.0):
+            __, new_client = self.pool.get(self.backend)
+        self.assertIsNot(client, new_client)
+
+    def test_client_in_use_not_closed(self):
+        self.backend.connection_idle_timeout = 10
+        with mock.patch("time.monotonic", return_value=1000.0):
+            with self.pool.use(self.backend):
+                __, client = self.pool.get(self.backend)
+                with mock.patch("time.monotonic", return_value=1011.0):
+                    __, same_client = self.pool.get(self.backend)
+                    self.pool.invalidate([self.backend.id])
+                    client.client.close.assert_not_called()
+        self.assertIs(client, same_client)
+        client.client.close.assert_called_once_with()
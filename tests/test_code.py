@@ -0,0 +1,21 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from odoo.tests.common import BaseCase
+
+from ..utils.code import like_escape, next_free_code
+
+
+class TestCode(BaseCase):
+    def test_free_code_kept(self):
+        self.assertEqual(next_free_code("REF", set()), "REF")
+        self.assertEqual(next_free_code("REF", {"REF_1"}), "REF")
+
+    def test_first_free_suffix(self):
+        self.assertEqual(next_free_code("REF", {"REF"}), "REF_1")
+        self.assertEqual(next_free_code("REF", {"REF", "REF_1", "REF_3"}), "REF_2")
+
+    def test_separator(self):
+        self.assertEqual(next_free_code("SO1", {"SO1"}, separator="-"), "SO1-1")
+
+    def test_like_escape(self):
+        self.assertEqual(like_escape("A_B%C\\D"), "A\\_B\\%C\\\\D")
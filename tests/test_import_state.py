@@ -0,0 +1,36 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from .common import PosTestCase
+
+
+class TestImportState(PosTestCase):
+    def setUp(self):
+        super().setUp()
+        self.state = self.backend._get_import_state("pos.res.partner")
+        self.state.write(
+            {
+                "page_size_min": 10,
+                "page_size_max": 300,
+                "page_size_step": 50,
+                "page_time_target": 5.0,
+                "page_payload_max": 100,
+            }
+        )
+
+    def test_grow_on_fast_full_page(self):
+        self.assertEqual(self.state.compute_next_page_size(100, 100, 1.0, 1024), 150)
+
+    def test_keep_on_short_page(self):
+        self.assertEqual(self.state.compute_next_page_size(100, 40, 1.0, 1024), 100)
+
+    def test_halve_on_slow_page(self):
+        self.assertEqual(self.state.compute_next_page_size(100, 100, 6.0, 1024), 50)
+
+    def test_halve_on_large_page(self):
+        self.assertEqual(
+            self.state.compute_next_page_size(100, 100, 1.0, 101 * 1024), 50
+        )
+
+    def test_bounds(self):
+        self.assertEqual(self.state.compute_next_page_size(280, 280, 1.0, 1024), 300)
+        self.assertEqual(self.state.compute_next_page_size(12, 12, 9.0, 1024), 10)
@@ -0,0 +1,43 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+import psycopg2
+
+from odoo.tools import mute_logger
+
+from odoo.addons.queue_job.exception import RetryableJobError
+
+from .common import PosTestCase
+
+
+class TestImporterUniqueViolation(PosTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.binding = cls._create_template_binding("Shirt")
+        cls.binding.pos_id = 10
+
+    def _create_binding(self, odoo_id, pos_id):
+        return (
+            self.env["pos.product.template"]
+            .with_context(connector_no_export=True)
+            .create(
+                {"odoo_id": odoo_id, "backend_id": self.backend.id, "pos_id": pos_id}
+            )
+        )
+
+    @mute_logger("odoo.sql_db")
+    def test_concurrent_import_retried(self):
+        other = self.env["product.template"].create({"name": "Other"})
+        with self.backend.work_on("pos.product.template") as work:
+            importer = work.component(usage="record.importer")
+            with self.assertRaises(RetryableJobError):
+                with importer._retry_unique_violation():
+                    self._create_binding(other.id, 10)
+
+    @mute_logger("odoo.sql_db")
+    def test_other_unique_violation_fails(self):
+        with self.backend.work_on("pos.product.template") as work:
+            importer = work.component(usage="record.importer")
+            with self.assertRaises(psycopg2.IntegrityError):
+                with importer._retry_unique_violation():
+                    self._create_binding(self.binding.odoo_id.id, 11)
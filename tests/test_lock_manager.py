@@ -0,0 +1,54 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from odoo.addons.queue_job.exception import RetryableJobError
+
+from .common import PosTestCase
+
+
+class TestImportLockManager(PosTestCase):
+    def _lock_in_other_transaction(self, cr, lock_manager, pos_id):
+        key = lock_manager._lock_key(lock_manager._lock_name(pos_id))
+        cr.execute("SELECT pg_try_advisory_xact_lock(%s)", (key,))
+        return cr.fetchone()[0]
+
+    def test_acquire_many(self):
+        with self.backend.work_on("pos.res.partner") as work:
+            lock_manager = work.component(usage="import.lock.manager")
+            acquired, busy = lock_manager.try_acquire([1, 2, 3])
+            self.assertEqual(sorted(acquired), [1, 2, 3])
+            self.assertFalse(busy)
+            self.assertTrue(lock_manager.is_held(2))
+            # already held by the job, not requested again
+            lock_manager.acquire_or_retry(2)
+            with self.registry.cursor() as cr:
+                self.assertFalse(self._lock_in_other_transaction(cr, lock_manager, 2))
+
+    def test_busy_records(self):
+        with self.backend.work_on("pos.res.partner") as work:
+            lock_manager = work.component(usage="import.lock.manager")
+            with self.registry.cursor() as cr:
+                self.assertTrue(self._lock_in_other_transaction(cr, lock_manager, 2))
+                acquired, busy = lock_manager.try_acquire([1, 2])
+                self.assertEqual(acquired, [1])
+                self.assertEqual(busy, [2])
+                with self.assertRaises(RetryableJobError):
+                    lock_manager.acquire_or_retry(2)
+
+    def test_locks_shared_by_child_work(self):
+        with self.backend.work_on("pos.res.partner") as work:
+            work.component(usage="import.lock.manager").try_acquire([1])
+            with work.work_on("pos.res.partner") as child_work:
+                lock_manager = child_work.component(usage="import.lock.manager")
+                self.assertTrue(lock_manager.is_held(1))
+
+    def test_locks_forgotten_on_rollback(self):
+        with self.backend.work_on("pos.res.partner") as work:
+            lock_manager = work.component(usage="import.lock.manager")
+            with self.assertRaises(ValueError):
+                with lock_manager.savepoint():
+                    lock_manager.try_acquire([1])
+                    raise ValueError()
+            self.assertFalse(lock_manager.is_held(1))
+            # released by PostgreSQL with the savepoint
+            with self.registry.cursor() as cr:
+                self.assertTrue(self._lock_in_other_transaction(cr, lock_manager, 1))
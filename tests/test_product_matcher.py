@@ -0,0 +1,67 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from odoo.exceptions import ValidationError
+
+from .common import PosTestCase
+
+
+class TestProductMatcher(PosTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        product_model = cls.env["product.product"]
+        cls.product_a = product_model.create(
+            {"name": "A", "default_code": "REF-A", "barcode": "111"}
+        )
+        cls.product_b = product_model.create({"name": "B", "default_code": "REF-B"})
+        cls.product_b2 = product_model.create({"name": "B2", "default_code": "REF-B"})
+
+    def test_prefetch_and_lookup(self):
+        records = [
+            {"id": 1, "barcode": "111", "reference": "REF-A"},
+            {"id": 2, "reference": "UNKNOWN", "variants": [{"variant_barcode": "222"}]},
+        ]
+        with self.backend.work_on("pos.product.template") as work:
+            matcher = work.component(usage="product.matcher")
+            matcher.prefetch(records)
+            with self.assertQueryCount(0):
+                self.assertEqual(matcher.products("barcode", "111"), self.product_a)
+                self.assertEqual(
+                    matcher.products("default_code", "REF-A"), self.product_a
+                )
+                self.assertFalse(matcher.products("barcode", "222"))
+                self.assertFalse(matcher.products("default_code", "UNKNOWN"))
+            self.assertEqual(
+                matcher.templates("default_code", "REF-A"),
+                self.product_a.product_tmpl_id,
+            )
+
+    def test_products_added_during_job(self):
+        with self.backend.work_on("pos.product.template") as work:
+            matcher = work.component(usage="product.matcher")
+            self.assertFalse(matcher.products("default_code", "NEW"))
+            product = self.env["product.product"].create(
+                {"name": "New", "default_code": "NEW"}
+            )
+            matcher.add(product)
+            self.assertEqual(matcher.products("default_code", "NEW"), product)
+
+    def test_index_per_job(self):
+        with self.backend.work_on("pos.product.template") as work:
+            work.component(usage="product.matcher").products("default_code", "LATER")
+        product = self.env["product.product"].create(
+            {"name": "Later", "default_code": "LATER"}
+        )
+        with self.backend.work_on("pos.product.template") as work:
+            matcher = work.component(usage="product.matcher")
+            self.assertEqual(matcher.products("default_code", "LATER"), product)
+
+    def test_check_duplicates(self):
+        with self.backend.work_on("pos.product.template") as work:
+            matcher = work.component(usage="product.matcher")
+            matcher.check_duplicates([{"id": 1, "reference": "REF-A"}], "default_code")
+            with self.assertRaises(ValidationError):
+                matcher.check_duplicates(
+                    [{"id": 2, "variants": [{"reference": "REF-B"}]}],
+                    "default_code",
+                )
@@ -0,0 +1,54 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from odoo.addons.queue_job.tests.common import trap_jobs
+
+from .common import PosTestCase
+
+
+class TestQuantityOutbox(PosTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.outbox = cls.env["pos.quantity.outbox"]
+        cls.binding = cls._create_variant_binding("AAA")
+
+    def _entries(self):
+        return self.outbox.search([("backend_id", "=", self.backend.id)])
+
+    def test_latest_quantity_kept(self):
+        self.outbox.enqueue(self.backend, {"AAA": 1.0, "BBB": 2.0})
+        queued_at = self._entries().filtered(lambda e: e.barcode == "AAA").queued_at
+        self.outbox.enqueue(self.backend, {"AAA": 5.0, False: 3.0})
+        entries = self._entries()
+        self.assertEqual(len(entries), 2)
+        entry = entries.filtered(lambda e: e.barcode == "AAA")
+        self.assertEqual(entry.quantity, 5.0)
+        self.assertEqual(entry.queued_at, queued_at)
+
+    def test_pop_after_debounce(self):
+        self.backend.stock_export_debounce = 3600
+        self.outbox.enqueue(self.backend, {"AAA": 1.0})
+        self.assertFalse(self.outbox._pop_due())
+        self.assertEqual(len(self._entries()), 1)
+        self.backend.stock_export_debounce = 0
+        self.assertEqual(self.outbox._pop_due(), {self.backend.id: [("AAA", 1.0)]})
+        self.assertFalse(self._entries())
+
+    def test_flush(self):
+        self.backend.stock_export_debounce = 0
+        self.outbox.enqueue(self.backend, {"AAA": 4.0, "UNBOUND": 1.0})
+        with trap_jobs() as trap:
+            self.outbox._scheduler_flush()
+            trap.assert_jobs_count(1)
+            backend, quantities = trap.enqueued_jobs[0].args
+        self.assertEqual(backend, self.backend)
+        self.assertEqual(
+            sorted(quantities, key=lambda q: q[1]),
+            [(self.binding.id, "AAA", 4.0), (None, "UNBOUND", 1.0)],
+        )
+        self.assertFalse(self._entries())
+
+    def test_variant_quantity_write(self):
+        self.binding.quantity = 7.0
+        entry = self._entries()
+        self.assertEqual((entry.barcode, entry.quantity), ("AAA", 7.0))
@@ -0,0 +1,80 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from unittest import mock
+
+from .common import PosTestCase
+
+
+class TestRecomputeQty(PosTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        attribute = cls.env["product.attribute"].create(
+            {
+                "name": "Size",
+                "value_ids": [(0, 0, {"name": name}) for name in ("S", "M", "L")],
+            }
+        )
+        cls.template_binding = cls._create_template_binding("Shirt")
+        cls.template_binding.odoo_id.attribute_line_ids = [
+            (
+                0,
+                0,
+                {
+                    "attribute_id": attribute.id,
+                    "value_ids": [(6, 0, attribute.value_ids.ids)],
+                },
+            )
+        ]
+        products = {
+            product.product_template_attribute_value_ids.name: product
+            for product in cls.template_binding.odoo_id.product_variant_ids
+        }
+        cls.variant_s, cls.variant_m, cls.variant_l = (
+            cls._create_variant_binding(
+                name, cls.template_binding, product=products[name]
+            )
+            for name in ("S", "M", "L")
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.variants = self.variant_s | self.variant_m | self.variant_l
+        self._set_stock(self.variant_s.odoo_id, 4.0)
+        self._set_stock(self.variant_m.odoo_id, 4.0)
+        self._set_stock(self.variant_l.odoo_id, -6.0)
+
+    def test_recompute_variants(self):
+        outbox = self.env["pos.quantity.outbox"]
+        with mock.patch.object(type(outbox), "enqueue", autospec=True) as enqueue:
+            self.variants.recompute_pos_qty()
+        self.assertEqual(self.variant_s.quantity, 4.0)
+        self.assertEqual(self.variant_m.quantity, 4.0)
+        self.assertEqual(self.variant_l.quantity, 0.0)
+        # one aggregated push for the changed bindings, not one per binding
+        self.assertEqual(enqueue.call_count, 1)
+        __, backend, quantities = enqueue.call_args.args
+        self.assertEqual(backend, self.backend)
+        self.assertEqual(quantities, {"S": 4.0, "M": 4.0})
+
+    def test_grouped_writes(self):
+        binding_model = type(self.env["pos.product.variant"])
+        with mock.patch.object(
+            binding_model, "write", autospec=True, side_effect=binding_model.write
+        ) as write:
+            self.variants.recompute_pos_qty()
+        # S and M share the same new quantity, L is unchanged
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(write.call_args.args[0], self.variant_s | self.variant_m)
+
+    def test_unchanged_not_written(self):
+        self.variants.recompute_pos_qty()
+        outbox = self.env["pos.quantity.outbox"]
+        with mock.patch.object(type(outbox), "enqueue", autospec=True) as enqueue:
+            self.variants.recompute_pos_qty()
+        enqueue.assert_not_called()
+
+    def test_template_total_clamped(self):
+        # 4 + 4 - 6: the total is pushed, not the sum of clamped variants
+        self.template_binding.recompute_pos_qty()
+        self.assertEqual(self.template_binding.quantity, 2.0)
@@ -0,0 +1,31 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from unittest import mock
+
+from ..components.backend_adapter import PosRecordCache
+from .common import PosTestCase
+
+
+class TestRecordCache(PosTestCase):
+    def test_least_recently_used_evicted(self):
+        cache = PosRecordCache(max_entries=2)
+        cache.set("products", "read", 1, {"id": 1})
+        cache.set("products", "read", 2, {"id": 2})
+        cache.get("products", "read", 1)
+        cache.set("products", "read", 3, {"id": 3})
+        self.assertTrue(cache.get("products", "read", 1)[0])
+        self.assertFalse(cache.get("products", "read", 2)[0])
+        self.assertTrue(cache.get("products", "read", 3)[0])
+
+    def test_list_pages_not_cached(self):
+        page = [{"id": 1}, {"id": 2}]
+        with self.backend.work_on("pos.res.partner") as work:
+            adapter = work.component(usage="backend.adapter")
+            with mock.patch.object(adapter, "client") as client:
+                client.list.return_value = page
+                adapter.list({"page": 1, "limit": 2})
+                adapter.list({"page": 1, "limit": 2})
+                self.assertEqual(client.list.call_count, 2)
+                # the records of the page are served to the reads
+                self.assertEqual(adapter.read(2), {"id": 2})
+                client.find.assert_not_called()
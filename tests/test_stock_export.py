@@ -0,0 +1,81 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from unittest import mock
+
+from odoo.addons.queue_job.tests.common import trap_jobs
+
+from ..models.product_product.common import ProductCombinationAdapter
+from .common import PosTestCase
+
+
+class TestStockExport(PosTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.backend.stock_export_chunk_size = 2
+        cls.binding_a = cls._create_variant_binding("AAA")
+        cls.binding_b = cls._create_variant_binding("BBB")
+        cls.binding_c = cls._create_variant_binding("CCC")
+
+    def setUp(self):
+        super().setUp()
+        self._set_stock(self.binding_a.odoo_id, 5.0)
+        self._set_stock(self.binding_c.odoo_id, -2.0)
+        self.failing_barcodes = set()
+        patcher = mock.patch.object(
+            ProductCombinationAdapter,
+            "update_new_quantity",
+            autospec=True,
+            side_effect=self._update_new_quantity,
+        )
+        self.update_new_quantity = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _update_new_quantity(self, adapter, barcode, new_qty):
+        return {"success": barcode not in self.failing_barcodes}
+
+    def _export(self):
+        with trap_jobs() as trap:
+            self.env["pos.product.variant"].export_product_stock_qty(self.backend)
+            jobs = list(trap.enqueued_jobs)
+            trap.perform_enqueued_jobs()
+        return jobs
+
+    def _pushed(self):
+        return {
+            call.kwargs["barcode"]: call.kwargs["new_qty"]
+            for call in self.update_new_quantity.call_args_list
+        }
+
+    def test_export_by_chunks(self):
+        jobs = self._export()
+        self.assertEqual(len(jobs), 2)
+        self.assertEqual(self._pushed(), {"AAA": 5.0, "BBB": 0.0, "CCC": 0.0})
+        self.assertEqual(self.binding_a.pos_exported_qty, 5.0)
+        self.assertTrue(self.binding_b.pos_qty_exported_at)
+
+    def test_export_changed_only(self):
+        self._export()
+        self.update_new_quantity.reset_mock()
+        self.assertFalse(self._export())
+        self._set_stock(self.binding_b.odoo_id, 3.0)
+        self._export()
+        self.assertEqual(self._pushed(), {"BBB": 3.0})
+
+    def test_failed_exported_again(self):
+        self.failing_barcodes = {"AAA"}
+        self._export()
+        self.assertFalse(self.binding_a.pos_qty_exported_at)
+        self.failing_barcodes = set()
+        self.update_new_quantity.reset_mock()
+        self._export()
+        self.assertEqual(self._pushed(), {"AAA": 5.0})
+
+    def test_force(self):
+        self._export()
+        self.update_new_quantity.reset_mock()
+        with trap_jobs() as trap:
+            self.env["pos.product.variant"].export_product_stock_qty(
+                self.backend, force=True
+            )
+            self.assertEqual(len(trap.enqueued_jobs), 2)
@@ -0,0 +1,55 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from .common import PosTestCase
+
+
+class TestStockLocations(PosTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        location_model = cls.env["stock.location"]
+        cls.shelf_1 = location_model.create(
+            {"name": "Shelf 1", "location_id": cls.stock_location.id}
+        )
+        cls.shelf_2 = location_model.create(
+            {"name": "Shelf 2", "location_id": cls.stock_location.id}
+        )
+
+    def _locations(self):
+        return self.backend._get_locations_for_stock_quantities()
+
+    def test_cached(self):
+        locations = self._locations()
+        self.assertIn(self.shelf_1, locations)
+        with self.assertQueryCount(0):
+            self.assertEqual(self._locations(), locations)
+
+    def test_synchronized_flag(self):
+        self.assertIn(self.shelf_2, self._locations())
+        self.shelf_1.pos_synchronized = True
+        self.assertEqual(self._locations(), self.shelf_1)
+
+    def test_location_moved(self):
+        self.assertIn(self.shelf_2, self._locations())
+        other_stock = self.env["stock.location"].create(
+            {"name": "Other", "usage": "internal"}
+        )
+        self.shelf_2.location_id = other_stock
+        self.assertNotIn(self.shelf_2, self._locations())
+
+    def test_location_usage(self):
+        self.shelf_2.usage = "view"
+        self.assertNotIn(self.shelf_2, self._locations())
+
+    def test_backend_location(self):
+        self.assertIn(self.shelf_2, self._locations())
+        self.backend.stock_location_id = self.shelf_1
+        self.assertEqual(self._locations(), self.shelf_1)
+
+    def test_quantities_follow_locations(self):
+        product = self._create_variant_binding("AAA").odoo_id
+        self._set_stock(product, 3.0, self.shelf_1)
+        self._set_stock(product, 2.0, self.shelf_2)
+        self.assertEqual(self.backend._get_stock_quantities(product), {product.id: 5.0})
+        self.shelf_2.pos_synchronized = True
+        self.assertEqual(self.backend._get_stock_quantities(product), {product.id: 2.0})
@@ -0,0 +1,46 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+from .common import PosTestCase
+
+
+class TestTaxCache(PosTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tax_group = cls.env["account.tax.group"].create({"name": "Pos VAT"})
+        cls.tax = cls.env["account.tax"].create(
+            {
+                "name": "Pos VAT 10%",
+                "amount": 10.0,
+                "price_include": True,
+                "type_tax_use": "sale",
+                "tax_group_id": cls.tax_group.id,
+            }
+        )
+
+    def test_price_factor(self):
+        self.assertAlmostEqual(self.backend._get_tax_price_factor(self.tax.id), 1.1)
+        self.assertEqual(self.backend._get_tax_price_factor(False), 1.0)
+
+    def test_price_factor_cleared_on_tax_change(self):
+        self.assertAlmostEqual(self.backend._get_tax_price_factor(self.tax.id), 1.1)
+        self.tax.amount = 20.0
+        self.assertAlmostEqual(self.backend._get_tax_price_factor(self.tax.id), 1.2)
+        self.tax.price_include = False
+        self.assertEqual(self.backend._get_tax_price_factor(self.tax.id), 1.0)
+
+    def test_price_factor_cleared_on_backend_change(self):
+        self.assertAlmostEqual(self.backend._get_tax_price_factor(self.tax.id), 1.1)
+        self.backend.taxes_included = True
+        self.assertEqual(self.backend._get_tax_price_factor(self.tax.id), 1.0)
+
+    def test_tax_group_taxes(self):
+        self.assertIsNone(self.backend._get_pos_tax_group_taxes(7))
+        self.env["pos.account.tax.group"].create(
+            {
+                "odoo_id": self.tax_group.id,
+                "backend_id": self.backend.id,
+                "pos_id": 7,
+            }
+        )
+        self.assertEqual(self.backend._get_pos_tax_group_taxes(7), (self.tax.id,))
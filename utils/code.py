@@ -0,0 +1,16 @@
+def like_escape(value):
+    """Escape the LIKE wildcards of `value`"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def next_free_code(code, taken, separator="_"):
+    """Return `code`, or `code` with the first numeric suffix not in `taken`.
+
+    `taken` is the set of the codes already used starting with `code`.
+    """
+    if code not in taken:
+        return code
+    i = 1
+    while "%s%s%d" % (code, separator, i) in taken:
+        i += 1
+    return "%s%s%d" % (code, separator, i)